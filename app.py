@@ -1,8 +1,25 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog, messagebox
+from collections import deque
+from document_formats import EXTRACTED_TEXT_SUFFIX
+from document_model import ParsedDocument
 from pdf_extractor import PDFExtractor
 import os
+import queue
+import threading
+
+# Extraction stages run on the worker thread, in order
+STAGES = [
+    ('text', "Extracting text"),
+    ('name', "Extracting personal info"),
+    ('skills', "Extracting skills"),
+    ('experience', "Extracting experience"),
+    ('summary', "Generating summary"),
+]
+
+# How often the Tk loop checks for results from the worker, in milliseconds
+POLL_INTERVAL = 100
 
 class PDFTextExtractorGUI:
     def __init__(self, root):
@@ -13,6 +30,15 @@ class PDFTextExtractorGUI:
         # Initialize PDF extractor
         self.pdf_extractor = PDFExtractor()
         
+        # Worker state: files waiting to be processed, results posted back by the worker
+        self.pending_files = deque()
+        self.results = queue.Queue()
+        self.worker = None
+        self.cancel_event = threading.Event()
+        self.current_file = None
+        self.files_done = 0
+        self.files_total = 0
+        
         # Create main frame
         self.main_frame = ttk.Frame(root, padding="10")
         self.main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -118,48 +144,59 @@ class PDFTextExtractorGUI:
         self.text_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         self.text_area.configure(yscrollcommand=self.text_scrollbar.set)
         
-        # Upload button
+        # Upload and cancel buttons
+        self.button_frame = ttk.Frame(self.main_frame)
+        self.button_frame.grid(row=1, column=0, padx=5, pady=5)
+        
         self.upload_button = ttk.Button(
-            self.main_frame,
-            text="Upload PDF",
+            self.button_frame,
+            text="Upload Resumes",
             style='Upload.TButton',
             command=self.upload_pdf
         )
-        self.upload_button.grid(row=1, column=0, padx=5, pady=5)
+        self.upload_button.grid(row=0, column=0, padx=5)
+        
+        self.cancel_button = ttk.Button(
+            self.button_frame,
+            text="Cancel",
+            command=self.cancel_extraction,
+            state='disabled'
+        )
+        self.cancel_button.grid(row=0, column=1, padx=5)
         
         # Status label
         self.status_label = ttk.Label(self.main_frame, text="")
         self.status_label.grid(row=2, column=0, padx=5, pady=5)
+        
+        # Per-stage progress of the current file
+        self.progress = ttk.Progressbar(self.main_frame, maximum=len(STAGES), length=300, mode='determinate')
+        self.progress.grid(row=3, column=0, padx=5, pady=5)
 
     def upload_pdf(self):
-        # Open file dialog to select PDF
-        file_path = filedialog.askopenfilename(
-            title="Select PDF",
-            filetypes=[("PDF files", "*.pdf")]
+        # Open file dialog to select one or more resumes
+        file_paths = filedialog.askopenfilenames(
+            title="Select Resumes",
+            filetypes=[("Resumes", "*.pdf *.docx *.txt"), ("PDF files", "*.pdf"),
+                       ("Word documents", "*.docx"), ("Text files", "*.txt")]
         )
         
-        if file_path:
-            try:
-                # Clear all previous data first
-                self.clear_all()
-                
-                # Update PDF path
-                self.pdf_extractor.pdf_path = file_path
-                
-                # Extract and display all information
-                self.extract_text()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to process PDF: {str(e)}")
-                self.status_label.config(
-                    text="Error processing PDF",
-                    foreground="red"
-                )
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to process PDF: {str(e)}")
-                self.status_label.config(
-                    text="Error processing PDF",
-                    foreground="red"
-                )
+        if file_paths:
+            # Queue the files; they are processed one after another on the worker
+            if not self.pending_files and self.worker is None:
+                self.files_done = 0
+                self.files_total = 0
+            self.pending_files.extend(file_paths)
+            self.files_total += len(file_paths)
+            self.cancel_button.configure(state='normal')
+            
+            if self.worker is None:
+                self.start_next_file()
+
+    def cancel_extraction(self):
+        # Stop the current file after its running stage and drop the queue
+        self.pending_files.clear()
+        self.cancel_event.set()
+        self.status_label.config(text="Cancelling...", foreground="black")
 
     def clear_all(self):
         # Clear personal info
@@ -175,121 +212,201 @@ class PDFTextExtractorGUI:
         
         # Clear status
         self.status_label.config(text="", foreground="black")
+        self.progress['value'] = 0
         
-        # Reset PDF extractor
-        self.pdf_extractor = PDFExtractor()
+        # Reset the previous document; the extractor and its models are reused
+        self.pdf_extractor.pdf_path = None
+        self.pdf_extractor.document = None
 
-    def extract_text(self):
+    def start_next_file(self):
+        if not self.pending_files:
+            self.worker = None
+            self.current_file = None
+            self.cancel_button.configure(state='disabled')
+            return
+        
+        # Clear all previous data first
+        self.clear_all()
+        
+        self.current_file = self.pending_files.popleft()
+        self.cancel_event.clear()
+        self.status_label.config(
+            text=f"Processing: {os.path.basename(self.current_file)} ({self.files_done + 1} of {self.files_total})",
+            foreground="green"
+        )
+        
+        self.worker = threading.Thread(
+            target=self.run_extraction,
+            args=(self.current_file, self.cancel_event),
+            daemon=True
+        )
+        self.worker.start()
+        self.root.after(POLL_INTERVAL, self.poll_results)
+
+    def run_extraction(self, file_path, cancel_event):
+        """Run every stage on the worker thread, posting each result to the queue
+
+        Tk widgets must only be touched from the main thread, so the worker
+        never updates the GUI itself; poll_results picks the messages up.
+        """
+        extractor = self.pdf_extractor
+        post = self.results.put
+        
         try:
-            # Extract text from PDF
-            text = self.pdf_extractor.extract_text(self.pdf_extractor.pdf_path)
+            # Parse page by page so a cancel doesn't wait for the whole document
+            document = ParsedDocument(path=file_path)
+            for page in extractor.iter_pages(file_path, document=document):
+                if cancel_event.is_set():
+                    post(('cancelled', file_path))
+                    return
+                document.add_page(page)
+            text = extractor.extract_text(document)
+            post(('stage', 'text', text))
             
-            # Update status
-            self.status_label.config(
-                text=f"Processing: {os.path.basename(self.pdf_extractor.pdf_path)}",
-                foreground="green"
-            )
+            stages = {
+                'name': lambda: (
+                    extractor.extract_name(text, document),
+                    extractor.extract_email(text),
+                    extractor.extract_phone(text)
+                ),
+                'skills': lambda: extractor.extract_skills(text, document),
+                'experience': lambda: extractor.extract_experience(text, document),
+            }
+            values = {}
+            for stage, _ in STAGES[1:-1]:
+                if cancel_event.is_set():
+                    post(('cancelled', file_path))
+                    return
+                try:
+                    values[stage] = stages[stage]()
+                except Exception as e:
+                    print(f"Error extracting {stage}: {str(e)}")
+                    values[stage] = None
+                post(('stage', stage, values[stage]))
             
-            # Extract and display personal info
-            name = self.pdf_extractor.extract_name(text)
-            email = self.pdf_extractor.extract_email(text)
-            phone = self.pdf_extractor.extract_phone(text)
+            if cancel_event.is_set():
+                post(('cancelled', file_path))
+                return
             
-            self.name_label.config(text=name)
-            self.email_label.config(text=email)
-            self.phone_label.config(text=phone)
-            
-            # Extract and display skills
             try:
-                skills = self.pdf_extractor.extract_skills(text)
-                if skills:
-                    self.skills_text.configure(state='normal')
-                    self.skills_text.delete(1.0, tk.END)
-                    for skill_dict in skills:
-                        category = skill_dict.get("category", "Unknown")
-                        tech_stack = skill_dict.get("tech_stack", [])
-                        if tech_stack:
-                            self.skills_text.insert(tk.END, f"\n{category}:\n")
-                            for skill in tech_stack:
-                                self.skills_text.insert(tk.END, f"- {skill}\n")
-                    self.skills_text.configure(state='disabled')
-                else:
-                    self.skills_text.configure(state='normal')
-                    self.skills_text.delete(1.0, tk.END)
-                    self.skills_text.insert(tk.END, "No skills found\n")
-                    self.skills_text.configure(state='disabled')
-            except Exception as e:
-                print(f"Error extracting skills: {str(e)}")
-                self.skills_text.configure(state='normal')
-                self.skills_text.delete(1.0, tk.END)
-                self.skills_text.insert(tk.END, "Error displaying skills\n")
-                self.skills_text.configure(state='disabled')
-            
-            # Extract and display experience
-            try:
-                experience = self.pdf_extractor.extract_experience(text)
-                if experience:
-                    self.exp_text.configure(state='normal')
-                    self.exp_text.delete(1.0, tk.END)
-                    for exp in experience:
-                        exp_text = f"""Position: {exp.get('position', 'Position not specified')}
-                            Company: {exp.get('company', 'Company not specified')}
-                            Duration: {exp.get('duration', 'Duration not specified')}
-                            Location: {exp.get('location', 'Location not specified')}
-
-                            """
-                        self.exp_text.insert(tk.END, exp_text)
-                    self.exp_text.configure(state='disabled')
-                else:
-                    self.exp_text.configure(state='normal')
-                    self.exp_text.delete(1.0, tk.END)
-                    self.exp_text.insert(tk.END, "No experience information found\n")
-                    self.exp_text.configure(state='disabled')
-            except Exception as e:
-                print(f"Error extracting experience: {str(e)}")
-                self.exp_text.configure(state='normal')
-                self.exp_text.delete(1.0, tk.END)
-                self.exp_text.insert(tk.END, "Error displaying experience\n")
-                self.exp_text.configure(state='disabled')
-            
-            # Display raw text
-            self.text_area.configure(state='normal')
-            self.text_area.delete(1.0, tk.END)
-            self.text_area.insert(tk.END, text)
-            self.text_area.configure(state='disabled')
-            
-            # Generate and display summary
-            try:
-                summary = self.pdf_extractor.generate_resume_summary(name, skills, experience)
-                self.summary_text.configure(state='normal')
-                self.summary_text.delete(1.0, tk.END)
-                self.summary_text.insert(tk.END, summary)
-                self.summary_text.configure(state='disabled')
+                name = values['name'][0] if values['name'] else ""
+                summary = extractor.generate_resume_summary(name, values['skills'] or [], values['experience'] or [])
             except Exception as e:
                 print(f"Error generating summary: {str(e)}")
-                self.summary_text.configure(state='normal')
-                self.summary_text.delete(1.0, tk.END)
-                self.summary_text.insert(tk.END, "Error generating summary\n")
-                self.summary_text.configure(state='disabled')
-            
-            # Update final status
+                summary = None
+            post(('stage', 'summary', summary))
             
             # Save to file
-            output_file = self.pdf_extractor.pdf_path.rsplit('.', 1)[0] + '_extracted.txt'
+            output_file = file_path.rsplit('.', 1)[0] + EXTRACTED_TEXT_SUFFIX
             with open(output_file, 'w', encoding='utf-8') as f:
                 f.write(text)
             
-            self.status_label.config(
-                text=f"Text extracted and saved to: {os.path.basename(output_file)}",
-                foreground="green"
-            )
-            
+            post(('done', output_file))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to extract text: {str(e)}")
+            post(('error', str(e)))
+
+    def poll_results(self):
+        # Apply every message the worker has posted since the last poll
+        while True:
+            try:
+                message = self.results.get_nowait()
+            except queue.Empty:
+                break
+            
+            kind = message[0]
+            if kind == 'stage':
+                self.show_stage(message[1], message[2])
+            elif kind == 'done':
+                self.finish_file(
+                    f"Text extracted and saved to: {os.path.basename(message[1])}",
+                    "green"
+                )
+                return
+            elif kind == 'cancelled':
+                self.finish_file("Extraction cancelled", "black")
+                return
+            elif kind == 'error':
+                messagebox.showerror("Error", f"Failed to extract text: {message[1]}")
+                self.finish_file("Error extracting text", "red")
+                return
+        
+        self.root.after(POLL_INTERVAL, self.poll_results)
+
+    def finish_file(self, status, color):
+        self.files_done += 1
+        self.status_label.config(text=status, foreground=color)
+        self.worker = None
+        self.start_next_file()
+
+    def show_stage(self, stage, value):
+        # Update the progress bar and the widgets for one finished stage
+        index = [name for name, _ in STAGES].index(stage)
+        self.progress['value'] = index + 1
+        if index + 1 < len(STAGES):
             self.status_label.config(
-                text="Error extracting text",
-                foreground="red"
+                text=f"{STAGES[index + 1][1]}: {os.path.basename(self.current_file)} "
+                     f"({self.files_done + 1} of {self.files_total})",
+                foreground="green"
             )
+        
+        if stage == 'text':
+            self.set_text(self.text_area, value)
+        elif stage == 'name':
+            name, email, phone = value or ("", "", "")
+            self.name_label.config(text=name)
+            self.email_label.config(text=email)
+            self.phone_label.config(text=phone)
+        elif stage == 'skills':
+            self.show_skills(value)
+        elif stage == 'experience':
+            self.show_experience(value)
+        elif stage == 'summary':
+            self.set_text(self.summary_text, value if value is not None else "Error generating summary\n")
+
+    def set_text(self, widget, text):
+        widget.configure(state='normal')
+        widget.delete(1.0, tk.END)
+        widget.insert(tk.END, text)
+        widget.configure(state='disabled')
+
+    def show_skills(self, skills):
+        if skills is None:
+            self.set_text(self.skills_text, "Error displaying skills\n")
+            return
+        if not skills:
+            self.set_text(self.skills_text, "No skills found\n")
+            return
+        
+        self.skills_text.configure(state='normal')
+        self.skills_text.delete(1.0, tk.END)
+        for skill_dict in skills:
+            category = skill_dict.get("category", "Unknown")
+            tech_stack = skill_dict.get("tech_stack", [])
+            if tech_stack:
+                self.skills_text.insert(tk.END, f"\n{category}:\n")
+                for skill in tech_stack:
+                    self.skills_text.insert(tk.END, f"- {skill}\n")
+        self.skills_text.configure(state='disabled')
+
+    def show_experience(self, experience):
+        if experience is None:
+            self.set_text(self.exp_text, "Error displaying experience\n")
+            return
+        if not experience:
+            self.set_text(self.exp_text, "No experience information found\n")
+            return
+        
+        self.exp_text.configure(state='normal')
+        self.exp_text.delete(1.0, tk.END)
+        for exp in experience:
+            exp_text = f"""Position: {exp.get('position', 'Position not specified')}
+                Company: {exp.get('company', 'Company not specified')}
+                Duration: {exp.get('duration', 'Duration not specified')}
+                Location: {exp.get('location', 'Location not specified')}
+
+                """
+            self.exp_text.insert(tk.END, exp_text)
+        self.exp_text.configure(state='disabled')
 
 def main():
     root = tk.Tk()
@@ -0,0 +1,247 @@
+import argparse
+import contextlib
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional
+
+from document_formats import EXTRACTED_TEXT_SUFFIX, SUPPORTED_EXTENSIONS
+from extraction_limits import DocumentTooLarge, ExtractionLimits
+from instrumentation import LogSink, PrometheusSink, metrics
+
+logger = logging.getLogger(__name__)
+
+RESUME_EXTENSIONS = SUPPORTED_EXTENSIONS
+
+# One extractor per worker process, created by the pool initializer
+_extractor = None
+
+
+def iter_resume_paths(source: str) -> Iterator[str]:
+    """Yield resume paths from a directory tree or a manifest file
+
+    Directory scans skip the text files the GUI saves next to each resume.
+    """
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for filename in sorted(files):
+                lowered = filename.lower()
+                if lowered.endswith(RESUME_EXTENSIONS) and not lowered.endswith(EXTRACTED_TEXT_SUFFIX):
+                    yield os.path.join(root, filename)
+        return
+
+    # Manifest: one path per line, relative paths resolved against the manifest
+    base_dir = os.path.dirname(os.path.abspath(source))
+    with open(source, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            yield line if os.path.isabs(line) else os.path.join(base_dir, line)
+
+
+def init_worker(cache_dir: str = None, cache_max_mb: float = None, limits: ExtractionLimits = None,
+                warm_up: bool = False, backend: str = None):
+    """Create the extractor once per worker process, optionally loading models up front"""
+    global _extractor
+    from pdf_extractor import PDFExtractor, cache_version
+    from result_cache import DEFAULT_MAX_BYTES, ResultCache
+
+    limits = limits or ExtractionLimits.from_env()
+    cache = None
+    if cache_dir:
+        max_bytes = int(cache_max_mb * 1024 * 1024) if cache_max_mb else DEFAULT_MAX_BYTES
+        cache = ResultCache(cache_dir, max_bytes, cache_version(backend, limits))
+    _extractor = PDFExtractor(cache=cache, backend=backend, limits=limits)
+
+    if warm_up:
+        # Load the spaCy pipeline and compile the skills before the first request
+        from skill_automaton import get_skill_automaton
+        get_skill_automaton()
+        _extractor.nlp
+
+
+def process_resume(path: str, include_text: bool = False, collect_metrics: bool = False,
+                   header_only: bool = False) -> Dict:
+    """Extract one resume, returning an error record instead of raising
+
+    With collect_metrics, the stage events recorded in this worker are
+    returned under 'metrics' so the parent process can feed its own sinks.
+    With header_only, only name, email and phone are extracted, reading the
+    first page and stopping as soon as both contacts are found.
+    """
+    if _extractor is None:
+        init_worker()
+
+    start = time.perf_counter()
+    cache_hits = _extractor.cache.hits if _extractor.cache is not None else 0
+    with metrics.collect() if collect_metrics else contextlib.nullcontext() as events:
+        try:
+            if header_only:
+                record = dict(_extractor.extract_header_fields(path), file=path)
+            else:
+                record = _extractor.extract_resume(path)
+        except DocumentTooLarge as e:
+            record = {'file': path, 'error': str(e), 'limits_hit': [e.limit]}
+        except Exception as e:
+            record = {'file': path, 'error': str(e)}
+    if collect_metrics:
+        record['metrics'] = events
+    if not include_text:
+        record.pop('text', None)
+    if _extractor.cache is not None:
+        record['cached'] = _extractor.cache.hits > cache_hits
+    record['seconds'] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def run_batch(paths: List[str], output_path: str, workers: int = None,
+              cache_dir: str = None, cache_max_mb: float = None,
+              include_text: bool = False, limits: ExtractionLimits = None, backend: str = None,
+              header_only: bool = False) -> Dict[str, int]:
+    """Process resumes across a pool of workers and write one JSON line per resume"""
+    workers = workers or os.cpu_count() or 1
+    counts = {'processed': 0, 'failed': 0, 'cached': 0}
+    collect_metrics = bool(metrics.sinks)
+
+    with open(output_path, 'w', encoding='utf-8') as out:
+        def write(record):
+            # Stage events from the workers go to this process's sinks
+            for event in record.pop('metrics', None) or []:
+                metrics.emit(event)
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            counts['failed' if 'error' in record else 'processed'] += 1
+            counts['cached'] += 1 if record.get('cached') else 0
+
+        if workers == 1:
+            # Run inline, which keeps tracebacks and debuggers simple
+            init_worker(cache_dir, cache_max_mb, limits, False, backend)
+            for path in paths:
+                write(process_resume(path, include_text, False, header_only))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                     initargs=(cache_dir, cache_max_mb, limits, False, backend)) as pool:
+                futures = [pool.submit(process_resume, path, include_text, collect_metrics, header_only) for path in paths]
+                for future in as_completed(futures):
+                    write(future.result())
+
+    return counts
+
+
+def refresh_cache(cache_dir: str, output_path: str, include_text: bool = False,
+                  limits: Optional[ExtractionLimits] = None, backend: Optional[str] = None) -> Dict[str, int]:
+    """Bring the cached results of one backend and limits up to date with skills.json and write them as JSONL
+
+    No resume is read: skills are matched again from the cached text, and
+    only for results whose skills section mentions a changed skill. Results
+    cached by another extractor version, backend or limits are left alone,
+    so each resume is written once.
+    """
+    from pdf_extractor import PDFExtractor, cache_version
+    from result_cache import ResultCache
+    from skills_db import save_skills_snapshot, skills_db_version
+
+    # Rewriting entries must not evict any
+    cache = ResultCache(cache_dir, sys.maxsize, cache_version(backend, limits))
+    extractor = PDFExtractor(cache=cache, backend=backend, limits=limits)
+    version = skills_db_version()
+    counts = {'processed': 0, 'updated': 0, 'rematched': 0, 'skipped': 0}
+
+    with open(output_path, 'w', encoding='utf-8') as out:
+        for key, record in cache.items():
+            if record.get('cache_version') != cache.version:
+                counts['skipped'] += 1
+                continue
+            if record.get('skills_version') != version:
+                counts['rematched'] += 1 if extractor.refresh_skills(record) else 0
+                cache.put(key, record)
+                counts['updated'] += 1
+            if not include_text:
+                record.pop('text', None)
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            counts['processed'] += 1
+    save_skills_snapshot(cache.snapshot_dir)
+    return counts
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Extract resume information in batch and write JSONL")
+    parser.add_argument('source', nargs='?', help="Directory of resumes or a manifest file with one path per line")
+    parser.add_argument('-o', '--output', default='results.jsonl', help="JSONL output file (default: results.jsonl)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument('--cache-dir', default=os.environ.get('RESUME_CACHE_DIR'), help="Reuse results for identical PDFs from this directory")
+    parser.add_argument('--cache-max-mb', type=float, default=None, help="Size bound of the result cache in MB (default: 256)")
+    parser.add_argument('--max-pages', type=int, default=None, help="Parse at most this many pages per resume (default: 30, 0 for no limit)")
+    parser.add_argument('--max-mb', type=float, default=None, help="Reject resumes larger than this many MB (default: 20, 0 for no limit)")
+    parser.add_argument('--max-chars', type=int, default=None, help="Stop reading a resume after this many characters (default: 200000, 0 for no limit)")
+    parser.add_argument('--max-seconds', type=float, default=None, help="Stop parsing a resume's pages after this many seconds (default: 30, 0 for no limit)")
+    parser.add_argument('--backend', default=None, help="PDF backend: auto, pypdf2, text, layout or a comma separated escalation chain (default: $RESUME_PDF_BACKEND or auto)")
+    parser.add_argument('--metrics-file', help="Write per-stage metrics in Prometheus text format to this file")
+    parser.add_argument('--metrics-log', action='store_true', help="Log one structured JSON line per extraction stage")
+    parser.add_argument('--refresh-skills', action='store_true', help="Instead of reading resumes, update the results in --cache-dir made with the same --backend and limits to the current skills.json")
+    parser.add_argument('--header-only', action='store_true', help="Only extract name, email and phone, from the first page")
+    parser.add_argument('--include-text', action='store_true', help="Include the extracted text in each record")
+    parser.add_argument('--export', metavar='DIR', help="Also write a candidates table and a sparse candidate x skill matrix to this directory")
+    parser.add_argument('--index', metavar='PATH', help="Also build an inverted skill index of the results at this path (see skill_index.py)")
+    parser.add_argument('--export-format', choices=['parquet', 'feather', 'csv'], default='parquet', help="Format of the candidates table (default: parquet, CSV if no Parquet engine is installed)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    prometheus = metrics.add_sink(PrometheusSink()) if args.metrics_file else None
+    if args.metrics_log:
+        metrics.add_sink(LogSink())
+
+    # Also selects which cached results --refresh-skills brings up to date
+    limits = ExtractionLimits.from_env(
+        max_bytes=int(args.max_mb * 1024 * 1024) if args.max_mb is not None else None,
+        max_pages=args.max_pages,
+        max_chars=args.max_chars,
+        max_seconds=args.max_seconds
+    )
+
+    start = time.perf_counter()
+    if args.refresh_skills:
+        if not args.cache_dir:
+            parser.error("--refresh-skills needs --cache-dir")
+        counts = refresh_cache(args.cache_dir, args.output, args.include_text, limits, args.backend)
+        logger.info(
+            f"Refreshed {counts['processed']} cached results ({counts['updated']} updated, "
+            f"{counts['rematched']} matched again, {counts['skipped']} from other versions or limits skipped) "
+            f"in {time.perf_counter() - start:.1f}s, "
+            f"results written to {args.output}"
+        )
+    else:
+        if not args.source:
+            parser.error("A directory of resumes or a manifest is required")
+        if not os.path.exists(args.source):
+            parser.error(f"No such directory or manifest: {args.source}")
+
+        paths = list(iter_resume_paths(args.source))
+        if not paths:
+            logger.warning(f"No resumes found in {args.source}")
+
+        counts = run_batch(paths, args.output, args.workers, args.cache_dir, args.cache_max_mb, args.include_text, limits, args.backend, args.header_only)
+        logger.info(
+            f"Processed {counts['processed']} resumes ({counts['failed']} failed, {counts['cached']} from cache) "
+            f"in {time.perf_counter() - start:.1f}s, results written to {args.output}"
+        )
+    if args.export:
+        from export import export_records, read_jsonl
+        paths = export_records(read_jsonl(args.output), args.export, args.export_format)
+        logger.info(f"Exported {paths['candidates']}, {paths['matrix']} and {paths['vocabulary']}")
+    if args.index:
+        from skill_index import build_index
+        index = build_index(args.output, args.index)
+        logger.info(f"Indexed {len(index)} resumes into {args.index}")
+    if prometheus is not None:
+        prometheus.dump(args.metrics_file)
+    return 1 if counts.get('failed') and not counts['processed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
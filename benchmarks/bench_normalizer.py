@@ -0,0 +1,68 @@
+"""Per-page cost of the single-pass normalizer against the previous re.sub chain
+
+Run from the repository root:
+
+    python -m benchmarks.bench_normalizer --pages 200
+"""
+import argparse
+import random
+import re
+import time
+
+from text_normalizer import normalize_text
+
+WORDS = (
+    "Senior Software Engineer Python AWS Docker Kubernetes led migration of "
+    "services to the cloud reduced latency improved reliability mentored team"
+).split()
+
+
+def layout_page(rng: random.Random, lines: int = 60, width: int = 110) -> str:
+    """Text shaped like pdfplumber's layout output: indented, padded, with blank lines"""
+    out = []
+    for _ in range(lines):
+        if rng.random() < 0.2:
+            out.append(' ' * width)
+            continue
+        indent = ' ' * rng.choice([0, 4, 8, 40])
+        body = '   '.join(' '.join(rng.sample(WORDS, 4)) for _ in range(rng.randint(1, 3)))
+        out.append((indent + body).ljust(width))
+    return '\n'.join(out)
+
+
+def legacy_clean(page_text: str) -> str:
+    """The per-page chain extract_text used before text_normalizer"""
+    page_text = re.sub(r'\n\s*\n\s*\n', '\n\n', page_text)
+    page_text = re.sub(r'\n\s*\n', '\n', page_text)
+    page_text = re.sub(r'\s{2,}', ' ', page_text)
+    page_text = '\n'.join(line for line in page_text.splitlines() if line.strip() or line == '')
+    page_text = re.sub(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', r'\1', page_text)
+    return page_text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    pages = [layout_page(rng) for _ in range(args.pages)]
+
+    start = time.perf_counter()
+    for page in pages:
+        legacy_clean(page)
+    legacy = (time.perf_counter() - start) / args.pages
+
+    start = time.perf_counter()
+    for page in pages:
+        normalize_text(page)
+    single = (time.perf_counter() - start) / args.pages
+
+    print(f"pages: {args.pages}, chars per page: {sum(map(len, pages)) // args.pages}")
+    print(f"re.sub chain:      {legacy * 1e6:8.1f} us/page")
+    print(f"single-pass:       {single * 1e6:8.1f} us/page")
+    print(f"saving per page:   {(legacy - single) * 1e6:8.1f} us ({legacy / single:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compare SkillClassifier's phrase matcher with the old token x pattern regex loop
+
+Run from the repository root:
+
+    python -m benchmarks.bench_skill_classifier --repeat 20
+"""
+import argparse
+import random
+import re
+import time
+from typing import Dict
+
+from skill_classifier import SkillClassifier
+from skills_db import iter_skills
+
+FILLER = (
+    "Worked with the team on software development and delivered features using "
+    "modern platform tooling with experience in continuous deployment"
+).split()
+
+
+def sample_text(classifier: SkillClassifier, words: int = 800, seed: int = 7) -> str:
+    """Build a resume-like text with skills scattered between filler words"""
+    rng = random.Random(seed)
+    skills = [skill for category, skill in iter_skills(classifier.skills_db)]
+    tokens = []
+    while len(tokens) < words:
+        tokens.extend(rng.sample(FILLER, 4))
+        tokens.append(rng.choice(skills))
+    return ' '.join(tokens)
+
+
+def legacy_patterns(classifier: SkillClassifier) -> Dict[str, str]:
+    """Patterns exactly as the previous _add_skill_pattern built them"""
+    patterns = {}
+    for category, skill in iter_skills(classifier.skills_db):
+        clean_skill = skill.lower().replace(' ', '|').replace('.', '\\.')
+        patterns.setdefault(clean_skill, skill)
+    return patterns
+
+
+def legacy_extract(classifier: SkillClassifier, patterns: Dict[str, str], text: str) -> int:
+    """The previous per-token loop calling re.search with every uncompiled pattern"""
+    doc = classifier.nlp(text)
+    found = 0
+    for token in doc:
+        for pattern in patterns:
+            if re.search(pattern, token.text.lower()):
+                skill = patterns[pattern]
+                if classifier._find_skill_category(skill):
+                    found += 1
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--words', type=int, default=800)
+    args = parser.parse_args(argv)
+
+    classifier = SkillClassifier()
+    if classifier.nlp is None:
+        raise SystemExit("spaCy model en_core_web_sm is required for this benchmark")
+
+    text = sample_text(classifier, args.words)
+    patterns = legacy_patterns(classifier)
+
+    # Warm up the model and the phrase matcher before timing
+    classifier.extract_skills(text)
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        legacy_extract(classifier, patterns, text)
+    legacy = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        classifier.extract_skills(text)
+    matcher = (time.perf_counter() - start) / args.repeat
+
+    print(f"words per document: {args.words}, skills: {len(patterns)}")
+    print(f"regex loop:     {legacy * 1000:8.1f} ms/doc")
+    print(f"phrase matcher: {matcher * 1000:8.1f} ms/doc")
+    print(f"speedup:        {legacy / matcher:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Measure cold start: import time of the extractor and time to the first result
+
+    python -m benchmarks.cold_start --target 5
+    python -m benchmarks.cold_start --pdf resume.pdf --top 20
+
+Each measurement runs in a fresh interpreter. The import report comes from
+``python -X importtime``; the first-result run imports pdf_extractor,
+constructs a PDFExtractor and extracts one resume with every network
+connection refused, so a startup that needs the network fails the check.
+The exit status is 1 when the first result takes longer than --target
+seconds or when anything tried to connect.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+from benchmarks.corpus import generate_resume
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_TARGET_SECONDS = 5.0
+
+# Runs in the child interpreter; prints one JSON line with the timings
+_FIRST_RESULT = r'''
+import json, socket, sys, time
+start = time.perf_counter()
+attempts = []
+
+def _refuse(self, address, *args, **kwargs):
+    attempts.append(str(address))
+    raise OSError("network disabled for the cold start check")
+
+socket.socket.connect = _refuse
+socket.socket.connect_ex = _refuse
+
+import pdf_extractor
+imported = time.perf_counter()
+extractor = pdf_extractor.PDFExtractor()
+constructed = time.perf_counter()
+record = extractor.extract_resume(sys.argv[1])
+finished = time.perf_counter()
+
+heavy = ('spacy', 'pdfplumber', 'PyPDF2', 'nltk', 'torch', 'transformers')
+print(json.dumps({
+    'import_seconds': imported - start,
+    'construct_seconds': constructed - imported,
+    'first_result_seconds': finished - start,
+    'network_attempts': attempts,
+    'loaded': [name for name in heavy if name in sys.modules],
+    'name': record.get('name'),
+}))
+'''
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable] + args, cwd=ROOT, capture_output=True, text=True)
+
+
+def import_report(module: str = 'pdf_extractor') -> Tuple[float, List[Tuple[str, float, float]]]:
+    """Total import seconds of a module and (package, self, cumulative) seconds for everything it imported"""
+    result = _run(['-X', 'importtime', '-c', f'import {module}'])
+    rows = []
+    total = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        package = name.strip()
+        rows.append((package, int(self_us) / 1e6, int(cumulative_us) / 1e6))
+        if package == module:
+            total = int(cumulative_us) / 1e6
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return total, rows
+
+
+def first_result(pdf_path: str) -> Dict:
+    """Time from interpreter start to the first extracted record, in a fresh process"""
+    result = _run(['-c', _FIRST_RESULT, pdf_path])
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "Cold start run failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Cold start report for the resume extractor")
+    parser.add_argument('--pdf', help="Resume to extract (default: a generated one)")
+    parser.add_argument('--target', type=float, default=DEFAULT_TARGET_SECONDS,
+                        help=f"Allowed seconds to the first result (default: {DEFAULT_TARGET_SECONDS:g})")
+    parser.add_argument('--top', type=int, default=15, help="Slowest imports to list")
+    args = parser.parse_args(argv)
+
+    total, rows = import_report()
+    print(f"import pdf_extractor: {total * 1000:.1f} ms")
+    print(f"{'package':48} {'self ms':>9} {'cumul. ms':>10}")
+    for package, self_seconds, cumulative in rows[:args.top]:
+        print(f"{package:48.48} {self_seconds * 1000:9.1f} {cumulative * 1000:10.1f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf
+        if not pdf_path:
+            pdf_path = os.path.join(tmp, 'resume.pdf')
+            generate_resume(pdf_path, random.Random(1))
+        report = first_result(os.path.abspath(pdf_path))
+
+    print(f"import: {report['import_seconds']:.3f}s, construct: {report['construct_seconds']:.3f}s, "
+          f"first result: {report['first_result_seconds']:.3f}s (target {args.target:g}s)")
+    print(f"heavy modules loaded: {', '.join(report['loaded']) or 'none'}")
+
+    failed = False
+    if report['network_attempts']:
+        print(f"Network connections attempted: {', '.join(report['network_attempts'])}")
+        failed = True
+    if report['first_result_seconds'] > args.target:
+        print(f"Cold start exceeds the {args.target:g}s target")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
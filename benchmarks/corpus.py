@@ -0,0 +1,210 @@
+"""Generate synthetic resume PDFs offline, with no PDF library required
+
+    python -m benchmarks.corpus out_dir --count 50 --seed 1
+"""
+import argparse
+import os
+import random
+import textwrap
+from typing import List, Tuple
+
+from skills_db import iter_skills, load_skills_db
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+MARGIN = 54
+GUTTER = 24
+
+FIRST_NAMES = ["Alice", "Brian", "Carmen", "David", "Elena", "Farid", "Grace", "Hiro", "Ines", "Jonas"]
+LAST_NAMES = ["Johnson", "Okafor", "Martinez", "Chen", "Novak", "Haddad", "Lindqvist", "Tanaka", "Silva", "Weber"]
+COMPANIES = ["Google", "Microsoft", "Acme Corporation", "Globex", "Initech", "Umbrella Health", "Stark Industries"]
+POSITIONS = ["Senior Software Engineer", "Data Analyst", "Product Manager", "DevOps Engineer",
+             "Backend Developer", "Machine Learning Engineer", "Project Coordinator"]
+LOCATIONS = ["Austin, TX", "Seattle, WA", "New York, NY", "Boston, MA", "Denver, CO"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+FILLER = ("designed built shipped maintained services platform customers reliability latency "
+          "pipeline migration team stakeholders reporting improved reduced automated delivered").split()
+
+# (x, y, font size, bold, text)
+Line = Tuple[float, float, float, bool, str]
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path: str, pages: List[List[Line]]):
+    """Write a minimal PDF with Helvetica and Helvetica-Bold text lines"""
+    objects = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b'')
+    pages_obj = add(b'')
+    regular = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+    bold = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>')
+
+    page_ids = []
+    for lines in pages:
+        stream = ''.join(
+            f"BT /{'F2' if is_bold else 'F1'} {size:g} Tf {x:.1f} {y:.1f} Td ({_escape(text)}) Tj ET\n"
+            for x, y, size, is_bold, text in lines
+        ).encode('latin-1', 'replace')
+        content = add(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'endstream')
+        page_ids.append(add(
+            (f'<< /Type /Page /Parent {pages_obj} 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] '
+             f'/Resources << /Font << /F1 {regular} 0 R /F2 {bold} 0 R >> >> /Contents {content} 0 R >>').encode()
+        ))
+
+    objects[catalog - 1] = f'<< /Type /Catalog /Pages {pages_obj} 0 R >>'.encode()
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects[pages_obj - 1] = f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>'.encode()
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        out += b'%010d 00000 n \n' % offset
+    out += b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, catalog, xref)
+
+    with open(path, 'wb') as f:
+        f.write(out)
+
+
+class _PageWriter:
+    """Lays text out top to bottom in one or two columns, starting new pages as needed"""
+
+    def __init__(self, columns: int):
+        self.pages: List[List[Line]] = [[]]
+        self.columns = columns
+        self.column = 0
+        self.y = PAGE_HEIGHT - MARGIN
+
+    @property
+    def x(self) -> float:
+        column_width = (PAGE_WIDTH - 2 * MARGIN) / self.columns
+        return MARGIN + self.column * column_width
+
+    def line(self, text: str, size: float = 10, bold: bool = False, gap: float = 4):
+        # Wrap to the column, leaving a gutter between columns (Helvetica averages about half an em per character)
+        column_width = (PAGE_WIDTH - 2 * MARGIN) / self.columns - (GUTTER if self.columns > 1 else 0)
+        lines = textwrap.wrap(text, max(10, int(column_width / (size * 0.55))))
+        for wrapped in lines[:-1]:
+            self._place(wrapped, size, bold, 1)
+        self._place(lines[-1] if lines else '', size, bold, gap)
+
+    def _place(self, text: str, size: float, bold: bool, gap: float):
+        if self.y < MARGIN + size:
+            if self.column + 1 < self.columns:
+                self.column += 1
+            else:
+                self.pages.append([])
+                self.column = 0
+            self.y = PAGE_HEIGHT - MARGIN
+        self.pages[-1].append((self.x, self.y, size, bold, text))
+        self.y -= size + gap
+
+    def next_column(self):
+        if self.column + 1 < self.columns:
+            self.column += 1
+            self.y = PAGE_HEIGHT - MARGIN - 60
+
+
+def _sentence(rng: random.Random, skills: List[str], skill_density: float) -> str:
+    words = rng.sample(FILLER, 6)
+    if rng.random() < skill_density:
+        words.insert(rng.randrange(len(words)), rng.choice(skills))
+    return ' '.join(words).capitalize() + '.'
+
+
+def generate_resume(path: str, rng: random.Random, pages: int = 1,
+                    columns: int = 1, skill_density: float = 0.3) -> dict:
+    """Write one synthetic resume and return the facts it was generated from"""
+    skills = [skill for _, skill in iter_skills(load_skills_db())]
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    name = f"{first} {last}"
+    listed = rng.sample(skills, max(3, int(len(skills) * skill_density / 4)))
+
+    writer = _PageWriter(columns)
+    writer.pages[0].append((MARGIN, PAGE_HEIGHT - MARGIN, 22, True, name))
+    writer.y -= 30
+    writer.line(f"{first.lower()}.{last.lower()}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}")
+    writer.line(f"linkedin.com/in/{first.lower()}{last.lower()} | {rng.choice(LOCATIONS)}", gap=14)
+
+    writer.line("SUMMARY", 12, True)
+    for _ in range(2):
+        writer.line(_sentence(rng, skills, skill_density))
+    writer.y -= 10
+
+    writer.line("SKILLS", 12, True)
+    for i in range(0, len(listed), 5):
+        writer.line(', '.join(listed[i:i + 5]))
+    writer.y -= 10
+
+    writer.line("EDUCATION", 12, True)
+    writer.line(f"B.Sc. Computer Science, State University, {rng.randint(2005, 2018)}")
+    writer.next_column()
+
+    writer.line("EXPERIENCE", 12, True)
+    year = 2024
+    for _ in range(rng.randint(2, 4)):
+        start = year - rng.randint(1, 4)
+        writer.line(f"{rng.choice(POSITIONS)} - {rng.choice(COMPANIES)}", 11, True)
+        writer.line(f"{rng.choice(MONTHS)} {start} - {rng.choice(MONTHS)} {year} | {rng.choice(LOCATIONS)}")
+        for _ in range(rng.randint(2, 4)):
+            writer.line(f"- {_sentence(rng, skills, skill_density)}")
+        writer.y -= 8
+        year = start
+
+    writer.line("PROJECTS", 12, True)
+    for _ in range(2):
+        writer.line(_sentence(rng, skills, skill_density))
+
+    # Appended work samples, as in portfolio PDFs
+    while len(writer.pages) < pages:
+        writer.pages.append([])
+        writer.column = 0
+        writer.y = PAGE_HEIGHT - MARGIN
+        writer.line(f"WORK SAMPLE {len(writer.pages) - 1}", 12, True)
+        while writer.y > MARGIN + 10:
+            writer.line(_sentence(rng, skills, skill_density))
+
+    write_pdf(path, writer.pages)
+    return {'file': path, 'name': name, 'skills': listed, 'pages': len(writer.pages), 'columns': columns}
+
+
+def generate_corpus(out_dir: str, count: int = 50, seed: int = 1) -> List[dict]:
+    """Generate a reproducible mix of layouts, page counts and skill densities"""
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    manifest = []
+    for i in range(count):
+        path = os.path.join(out_dir, f"resume_{i:04d}.pdf")
+        manifest.append(generate_resume(
+            path, rng,
+            pages=rng.choice([1, 1, 1, 2, 2, 3, 8]),
+            columns=rng.choice([1, 1, 2]),
+            skill_density=rng.choice([0.1, 0.3, 0.6])
+        ))
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('out_dir')
+    parser.add_argument('--count', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    manifest = generate_corpus(args.out_dir, args.count, args.seed)
+    print(f"Wrote {len(manifest)} resumes to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
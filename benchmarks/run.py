@@ -0,0 +1,178 @@
+"""Time every extraction stage over a synthetic corpus and compare against a baseline
+
+    python -m benchmarks.run --count 50 --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --count 50 --baseline benchmarks/baseline.json
+
+The corpus is generated offline with benchmarks.corpus (or read from --corpus).
+Each stage is timed separately per document; the report lists p50/p95/p99
+latency per stage and overall throughput. With --baseline, any stage whose
+p50 or p95 is more than --threshold slower than the baseline is flagged and
+the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, List
+
+from benchmarks.corpus import generate_corpus
+from model_registry import registry
+
+STAGES = [
+    'extract_text',
+    'extract_email/extract_phone',
+    'extract_name',
+    'extract_skills',
+    'SkillClassifier.extract_skills',
+    'extract_experience',
+    'generate_resume_summary',
+]
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def time_document(extractor, path: str) -> Dict[str, float]:
+    """Run each stage on one document and return seconds per stage"""
+    timings = OrderedDict()
+
+    def timed(stage, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+        return result
+
+    # Repeats parse the same text, which the extractor's per-text memos would answer
+    extractor._contacts = None
+    extractor._sections = None
+    document = timed('extract_text', extractor.parse_document, path)
+    text = extractor.extract_text(document)
+    # The one contact scan (and the section split it starts from) serves email, phone and
+    # the name's email check, so it is timed first, as extract_resume runs it
+    timed('extract_email/extract_phone', extractor.extract_contacts, text)
+    name = timed('extract_name', extractor.extract_name, text, document)
+    skills = timed('extract_skills', extractor.extract_skills, text, document)
+    if extractor.skill_classifier is not None:
+        timed('SkillClassifier.extract_skills', extractor.skill_classifier.extract_skills, text)
+    experience = timed('extract_experience', extractor.extract_experience, text, document)
+    timed('generate_resume_summary', extractor.generate_resume_summary, name, skills, experience)
+    return timings
+
+
+def run(paths: List[str], repeat: int = 1) -> Dict:
+    from pdf_extractor import PDFExtractor
+
+    extractor = PDFExtractor()
+
+    # Warm up: model loads and skill compilation are reported separately
+    start = time.perf_counter()
+    time_document(extractor, paths[0])
+    warm_up = time.perf_counter() - start
+
+    samples = {stage: [] for stage in STAGES}
+    totals = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in paths:
+            timings = time_document(extractor, path)
+            for stage, seconds in timings.items():
+                samples[stage].append(seconds)
+            totals.append(sum(timings.values()))
+    elapsed = time.perf_counter() - start
+
+    stages = OrderedDict()
+    for stage in STAGES:
+        values = samples[stage]
+        stages[stage] = {
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'p99': percentile(values, 99),
+            'mean': sum(values) / len(values) if values else 0.0,
+        }
+    return {
+        'documents': len(totals),
+        'throughput_docs_per_s': len(totals) / elapsed if elapsed else 0.0,
+        'total': {'p50': percentile(totals, 50), 'p95': percentile(totals, 95), 'p99': percentile(totals, 99)},
+        'warm_up_seconds': warm_up,
+        'models': registry.stats(),
+        'stages': stages,
+        'environment': {'python': platform.python_version(), 'machine': platform.machine()},
+    }
+
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Stages whose p50 or p95 regressed by more than threshold (0.2 = 20%)"""
+    regressions = []
+    for stage, values in report['stages'].items():
+        base = baseline.get('stages', {}).get(stage)
+        if not base:
+            continue
+        for metric in ('p50', 'p95'):
+            # Ignore sub-millisecond noise
+            if base[metric] > 0.0005 and values[metric] > base[metric] * (1 + threshold):
+                regressions.append(
+                    f"{stage} {metric}: {values[metric] * 1000:.1f} ms vs baseline {base[metric] * 1000:.1f} ms"
+                )
+    return regressions
+
+
+def print_report(report: Dict):
+    print(f"documents: {report['documents']}, throughput: {report['throughput_docs_per_s']:.2f} docs/s, "
+          f"warm-up: {report['warm_up_seconds']:.2f}s")
+    print(f"{'stage':34} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for stage, values in list(report['stages'].items()) + [('total', report['total'])]:
+        print(f"{stage:34} {values['p50'] * 1000:9.2f} {values['p95'] * 1000:9.2f} {values['p99'] * 1000:9.2f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Resume extraction benchmark")
+    parser.add_argument('--corpus', help="Directory of PDFs to use instead of a generated corpus")
+    parser.add_argument('--count', type=int, default=30, help="Synthetic resumes to generate")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--save-baseline', help="Write the report to this JSON file")
+    parser.add_argument('--baseline', help="Compare against this JSON report")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Allowed slowdown before flagging (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.corpus:
+            paths = sorted(os.path.join(args.corpus, f) for f in os.listdir(args.corpus) if f.lower().endswith('.pdf'))
+        else:
+            paths = [entry['file'] for entry in generate_corpus(tmp, args.count, args.seed)]
+        if not paths:
+            print("No PDFs to benchmark", file=sys.stderr)
+            return 1
+        report = run(paths, args.repeat)
+
+    print_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print("Regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
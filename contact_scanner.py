@@ -0,0 +1,50 @@
+import re
+from typing import Dict
+
+# Contact details nearly always sit at the top; the rest of the text is only
+# scanned when the email or phone number is still missing
+HEADER_CHARS = 2000
+
+CONTACT_FIELDS = ('email', 'phone', 'linkedin', 'github')
+
+# One alternation, so a single scan finds every field. At the same position
+# the earlier alternative wins, so digits inside an email or URL are never
+# taken for a phone number.
+CONTACT_PATTERN = re.compile(r'''
+    (?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})
+  | (?P<linkedin>(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[\w%-]+/?)
+  | (?P<github>(?:https?://)?(?:www\.)?github\.com/[\w-]+/?)
+  | (?P<phone>
+        \+?[0-9]{1,3}[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}  # International format
+      | \(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}                       # Local and 10-digit formats
+    )
+''', re.VERBOSE | re.IGNORECASE)
+
+_PHONE_JUNK = re.compile(r'[^0-9+]')
+
+
+def scan_contacts(text: str, header_chars: int = HEADER_CHARS) -> Dict[str, str]:
+    """Find email, phone, LinkedIn and GitHub in one pass, starting with the header region
+
+    Returns the first match of each field, or "" when it is absent. The scan
+    stops once every field is found, or once it has left the header region
+    with both email and phone found.
+    """
+    found = dict.fromkeys(CONTACT_FIELDS, "")
+    if not text:
+        return found
+
+    missing = len(CONTACT_FIELDS)
+    for match in CONTACT_PATTERN.finditer(text):
+        if match.start() >= header_chars and found['email'] and found['phone']:
+            break
+        field = match.lastgroup
+        if found[field]:
+            continue
+        value = match.group(field)
+        # Clean up the phone number
+        found[field] = _PHONE_JUNK.sub('', value) if field == 'phone' else value.rstrip('/')
+        missing -= 1
+        if not missing:
+            break
+    return found
@@ -0,0 +1,128 @@
+"""Resume formats other than PDF, read into the same document model
+
+DOCX and plain text have no layout to reconstruct: the text comes straight
+from the file, so each document becomes a single page.
+"""
+import os
+from typing import Iterator, List, Optional
+
+from document_model import Page, ParsedDocument, Word
+from text_normalizer import normalize_text
+
+# File extension of each format the extractor reads
+FORMATS = {'.pdf': 'pdf', '.docx': 'docx', '.txt': 'txt'}
+SUPPORTED_EXTENSIONS = tuple(FORMATS)
+
+# Suffix of the text the GUI saves next to each resume; such files are not resumes
+EXTRACTED_TEXT_SUFFIX = '_extracted.txt'
+
+# Encodings tried in order for plain text; latin-1 decodes any bytes
+TEXT_ENCODINGS = ('utf-8-sig', 'cp1252', 'latin-1')
+
+
+def document_format(path: str) -> str:
+    """'pdf', 'docx' or 'txt' from the file extension; files without one are taken for PDFs"""
+    extension = os.path.splitext(path)[1].lower()
+    if not extension:
+        return 'pdf'
+    if extension not in FORMATS:
+        raise ValueError(f"Unsupported file type: {extension} (use {', '.join(SUPPORTED_EXTENSIONS)})")
+    return FORMATS[extension]
+
+
+def _style_value(style, attribute: str):
+    """A font attribute as set on a style or inherited from its base styles"""
+    while style is not None:
+        value = getattr(style.font, attribute)
+        if value is not None:
+            return value
+        style = style.base_style
+    return None
+
+
+def _iter_paragraphs(container) -> Iterator:
+    """Paragraphs of a body, header or table cell in reading order, descending into tables"""
+    from docx.oxml.ns import qn
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+    for child in container._element.iterchildren():
+        if child.tag == qn('w:p'):
+            yield Paragraph(child, container)
+        elif child.tag == qn('w:tbl'):
+            for row in Table(child, container).rows:
+                # Merged cells are returned once per grid column they span
+                seen = set()
+                for cell in row.cells:
+                    if id(cell._tc) in seen:
+                        continue
+                    seen.add(id(cell._tc))
+                    yield from _iter_paragraphs(cell)
+
+
+def _paragraph_words(paragraph, line: int) -> List[Word]:
+    """Words of a paragraph with the size and boldness of the run they are in"""
+    style_size = _style_value(paragraph.style, 'size')
+    style_bold = _style_value(paragraph.style, 'bold')
+    style_name = _style_value(paragraph.style, 'name') or ''
+    words = []
+    for run in paragraph.runs:
+        size = run.font.size or style_size
+        bold = run.bold if run.bold is not None else style_bold
+        fontname = run.font.name or style_name
+        # Same convention as PDF font names, e.g. Helvetica-Bold
+        if bold:
+            fontname = f"{fontname}-Bold" if fontname else 'Bold'
+        for text in run.text.split():
+            words.append(Word(text=text, size=size.pt if size else 0.0, fontname=fontname, top=float(line)))
+    return words
+
+
+def read_docx(path: str) -> Page:
+    """Read a DOCX file's headers, paragraphs and tables as one page"""
+    import docx
+
+    source = docx.Document(path)
+    containers = []
+    for section in source.sections[:1]:
+        if not section.header.is_linked_to_previous:
+            containers.append(section.header)
+    containers.append(source._body)
+
+    lines = []
+    words = []
+    for container in containers:
+        for paragraph in _iter_paragraphs(container):
+            text = ' '.join(paragraph.text.split())
+            if not text:
+                continue
+            words.extend(_paragraph_words(paragraph, len(lines)))
+            lines.append(text)
+    return Page(number=1, text='\n'.join(lines), words=words, backend='docx')
+
+
+def read_txt(path: str) -> Page:
+    """Read a plain text file as one page"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    for encoding in TEXT_ENCODINGS:
+        try:
+            text = data.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    return Page(number=1, text=normalize_text(text), backend='txt')
+
+
+def iter_pages(path: str, document: ParsedDocument, file_format: Optional[str] = None) -> Iterator[Page]:
+    """Yield the single page of a DOCX or text file and set the document's backend"""
+    file_format = file_format or document_format(path)
+    if file_format == 'docx':
+        page = read_docx(path)
+    elif file_format == 'txt':
+        page = read_txt(path)
+    else:
+        raise ValueError(f"Not a DOCX or text file: {path}")
+    document.backend = page.backend
+    if page.text:
+        yield page
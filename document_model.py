@@ -0,0 +1,75 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Word:
+    """A single word on a page with its font information"""
+    text: str
+    size: float = 0.0
+    fontname: str = ""
+    x0: float = 0.0
+    top: float = 0.0
+    x1: float = 0.0
+
+    @property
+    def is_bold(self) -> bool:
+        """Check if the word is set in a bold font"""
+        return 'bold' in self.fontname.lower()
+
+
+@dataclass
+class Page:
+    """Text, words and metadata for one page of a document"""
+    number: int
+    text: str
+    words: List[Word] = field(default_factory=list)
+    width: float = 0.0
+    height: float = 0.0
+    # Backend that produced the text: pypdf2, text or layout for PDFs, docx or txt otherwise
+    backend: str = ""
+
+
+@dataclass
+class ParsedDocument:
+    """A document parsed once and shared by every extractor"""
+    path: str
+    pages: List[Page] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    # Backends that contributed pages, e.g. 'text' or 'text+layout'
+    backend: str = ""
+    # Set when a resource limit stopped parsing before the end of the document
+    truncated: bool = False
+    # Limits that were reached: bytes, pages, chars or seconds
+    limits_hit: List[str] = field(default_factory=list)
+    # Character spans of the text's sections (contact, summary, skills, ...), set by the segmenter
+    sections: Optional[Dict[str, Tuple[int, int]]] = None
+    _text: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def text(self) -> str:
+        """Full document text with pages joined by newlines"""
+        if self._text is None:
+            self._text = '\n'.join(page.text for page in self.pages if page.text).strip()
+        return self._text
+
+    def add_page(self, page: Page):
+        """Append a parsed page, dropping the text and sections computed from the earlier pages"""
+        self.pages.append(page)
+        self._text = None
+        self.sections = None
+
+    def hit_limit(self, limit: str):
+        """Record that a resource limit cut this document short"""
+        self.truncated = True
+        if limit not in self.limits_hit:
+            self.limits_hit.append(limit)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    @property
+    def first_page_words(self) -> List[Word]:
+        """Words on the first page, used for font based heuristics"""
+        return self.pages[0].words if self.pages else []
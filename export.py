@@ -0,0 +1,191 @@
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from skills_db import build_category_index, load_skills_db, skill_vocabulary
+
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None
+
+# Scalar record fields kept as columns of the candidates table
+CANDIDATE_COLUMNS = [
+    'file', 'name', 'email', 'phone', 'linkedin', 'github',
+    'backend', 'cached', 'seconds', 'error'
+]
+
+EXPORT_FORMATS = ('parquet', 'feather', 'csv')
+
+CANDIDATES_FILE = 'candidates'
+MATRIX_FILE = 'skills.npz'
+VOCABULARY_FILE = 'skills.json'
+
+
+class SkillMatrix(NamedTuple):
+    """Compressed sparse row candidate x skill matrix as plain NumPy arrays, used without SciPy"""
+    data: np.ndarray
+    indices: np.ndarray
+    indptr: np.ndarray
+    shape: Tuple[int, int]
+
+    def dot(self, vector: np.ndarray) -> np.ndarray:
+        """Matrix-vector product, as scipy.sparse's matrix.dot"""
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return np.bincount(rows, weights=self.data * vector[self.indices], minlength=self.shape[0])
+
+    def column_counts(self) -> np.ndarray:
+        return np.bincount(self.indices, minlength=self.shape[1])
+
+    def column(self, index: int) -> np.ndarray:
+        """Boolean mask of the rows that have the given column"""
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        mask = np.zeros(self.shape[0], dtype=bool)
+        mask[rows[self.indices == index]] = True
+        return mask
+
+
+def record_skills(record: Dict) -> Iterator[str]:
+    """Lowercase names of the skills found in an extraction record"""
+    for group in record.get('skills') or []:
+        if isinstance(group, dict):
+            for skill in group.get('tech_stack') or []:
+                yield skill.lower()
+
+
+def build_skill_matrix(records: Iterable[Dict], vocabulary: List[str]):
+    """Candidate x skill matrix, one row per record, with 1 where the candidate has the skill
+
+    Returns a scipy.sparse CSR matrix when SciPy is installed, otherwise a
+    SkillMatrix with the same CSR arrays. Skills outside the vocabulary
+    are ignored.
+    """
+    column_of = {skill: column for column, skill in enumerate(vocabulary)}
+    indices: List[int] = []
+    indptr = [0]
+    for record in records:
+        indices.extend(sorted({column_of[skill] for skill in record_skills(record) if skill in column_of}))
+        indptr.append(len(indices))
+
+    shape = (len(indptr) - 1, len(vocabulary))
+    data = np.ones(len(indices), dtype=np.int8)
+    indices = np.asarray(indices, dtype=np.int32)
+    indptr = np.asarray(indptr, dtype=np.int64)
+    if sparse is not None:
+        return sparse.csr_matrix((data, indices, indptr), shape=shape)
+    return SkillMatrix(data, indices, indptr, shape)
+
+
+def skill_counts(matrix) -> np.ndarray:
+    """Number of candidates with each skill, by column"""
+    if isinstance(matrix, SkillMatrix):
+        return matrix.column_counts()
+    return np.asarray((matrix != 0).sum(axis=0)).ravel()
+
+
+def candidates_with(matrix, vocabulary: List[str], skill: str) -> np.ndarray:
+    """Boolean mask over candidates that have the skill"""
+    column = vocabulary.index(skill.lower())
+    if isinstance(matrix, SkillMatrix):
+        return matrix.column(column)
+    return np.asarray(matrix[:, column].todense()).ravel() != 0
+
+
+def records_to_frame(records: Iterable[Dict]):
+    """Candidates table with one row per record and the scalar fields as columns"""
+    import pandas as pd
+
+    rows = []
+    for record in records:
+        row = {column: record.get(column) for column in CANDIDATE_COLUMNS}
+        row['skill_count'] = len(set(record_skills(record)))
+        row['experience_count'] = len(record.get('experience') or [])
+        row['limits_hit'] = ','.join(record.get('limits_hit') or [])
+        rows.append(row)
+    return pd.DataFrame(rows, columns=CANDIDATE_COLUMNS + ['skill_count', 'experience_count', 'limits_hit'])
+
+
+def _write_frame(frame, directory: str, export_format: str) -> str:
+    """Write the table as Parquet or Feather, falling back to CSV without a Parquet engine"""
+    if export_format in ('parquet', 'feather'):
+        path = os.path.join(directory, f"{CANDIDATES_FILE}.{export_format}")
+        try:
+            if export_format == 'parquet':
+                frame.to_parquet(path, index=False)
+            else:
+                frame.to_feather(path)
+            return path
+        except ImportError as e:
+            print(f"Warning: Could not write {export_format}, writing CSV instead: {str(e)}")
+    path = os.path.join(directory, f"{CANDIDATES_FILE}.csv")
+    frame.to_csv(path, index=False)
+    return path
+
+
+def save_skill_matrix(matrix, path: str):
+    """Save in the scipy.sparse.save_npz layout, readable by load_npz with or without SciPy"""
+    if isinstance(matrix, SkillMatrix):
+        np.savez_compressed(path, data=matrix.data, indices=matrix.indices, indptr=matrix.indptr,
+                            shape=np.asarray(matrix.shape), format=np.asarray(b'csr'))
+    else:
+        sparse.save_npz(path, matrix.tocsr())
+
+
+def load_skill_matrix(path: str):
+    """Load a matrix written by save_skill_matrix"""
+    if sparse is not None:
+        return sparse.load_npz(path)
+    with np.load(path) as arrays:
+        return SkillMatrix(arrays['data'], arrays['indices'], arrays['indptr'], tuple(arrays['shape']))
+
+
+def export_records(records: List[Dict], directory: str, export_format: str = 'parquet',
+                   skills_db: Optional[Dict] = None) -> Dict[str, str]:
+    """Write the candidates table, the skill matrix and its vocabulary to a directory
+
+    Row i of the matrix is row i of the table; column j is skill j of the
+    vocabulary file, which lists each skill's ID (its lowercase name) and
+    categories.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {export_format}")
+    os.makedirs(directory, exist_ok=True)
+    skills_db = skills_db if skills_db is not None else load_skills_db()
+    vocabulary = skill_vocabulary(skills_db)
+    categories = build_category_index(skills_db)
+
+    paths = {'candidates': _write_frame(records_to_frame(records), directory, export_format)}
+
+    paths['matrix'] = os.path.join(directory, MATRIX_FILE)
+    save_skill_matrix(build_skill_matrix(records, vocabulary), paths['matrix'])
+
+    paths['vocabulary'] = os.path.join(directory, VOCABULARY_FILE)
+    with open(paths['vocabulary'], 'w', encoding='utf-8') as f:
+        json.dump([{'id': skill, 'categories': categories[skill]} for skill in vocabulary], f, indent=2)
+    return paths
+
+
+def load_export(directory: str):
+    """Read an export back as (candidates DataFrame, skill matrix, vocabulary)"""
+    import pandas as pd
+
+    for export_format in EXPORT_FORMATS:
+        path = os.path.join(directory, f"{CANDIDATES_FILE}.{export_format}")
+        if os.path.exists(path):
+            reader = {'parquet': pd.read_parquet, 'feather': pd.read_feather, 'csv': pd.read_csv}[export_format]
+            frame = reader(path)
+            break
+    else:
+        raise FileNotFoundError(f"No candidates table in {directory}")
+
+    with open(os.path.join(directory, VOCABULARY_FILE), 'r', encoding='utf-8') as f:
+        vocabulary = [entry['id'] for entry in json.load(f)]
+    return frame, load_skill_matrix(os.path.join(directory, MATRIX_FILE)), vocabulary
+
+
+def read_jsonl(path: str) -> List[Dict]:
+    """Records of a batch output file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,58 @@
+import os
+from dataclasses import dataclass, replace
+from typing import Optional
+
+# Defaults sized for resumes; portfolios with appended work samples are cut short
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+# Page cap so long portfolios with appended work samples don't stall the pipeline
+DEFAULT_MAX_PAGES = 30
+# Well under spaCy's default nlp.max_length of 1,000,000 characters
+DEFAULT_MAX_CHARS = 200_000
+DEFAULT_MAX_SECONDS = 30.0
+
+# Names reported in a record's limits_hit
+BYTES = 'bytes'
+PAGES = 'pages'
+CHARS = 'chars'
+SECONDS = 'seconds'
+
+
+class DocumentTooLarge(ValueError):
+    """Raised when a document is rejected before parsing because it exceeds a limit"""
+
+    def __init__(self, limit: str, message: str):
+        super().__init__(message)
+        self.limit = limit
+
+
+@dataclass(frozen=True)
+class ExtractionLimits:
+    """Per-document resource limits; None disables a limit
+
+    Files over max_bytes are rejected. Documents over max_pages, max_chars or
+    max_seconds are truncated: parsing stops at the page or character where
+    the limit was reached and the rest of the pipeline runs on what was read.
+    The time limit is checked between pages, after the first one.
+    """
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES
+    max_chars: Optional[int] = DEFAULT_MAX_CHARS
+    max_seconds: Optional[float] = DEFAULT_MAX_SECONDS
+
+    @classmethod
+    def from_env(cls, **overrides) -> 'ExtractionLimits':
+        """Defaults, then RESUME_MAX_MB/PAGES/CHARS/SECONDS, then overrides that are not None
+
+        A value of 0, in the environment or as an override, disables that limit.
+        """
+        limits = cls()
+        for field_name, variable, convert in (
+            ('max_bytes', 'RESUME_MAX_MB', lambda value: int(float(value) * 1024 * 1024)),
+            ('max_pages', 'RESUME_MAX_PAGES', int),
+            ('max_chars', 'RESUME_MAX_CHARS', int),
+            ('max_seconds', 'RESUME_MAX_SECONDS', float),
+        ):
+            value = os.environ.get(variable)
+            if value:
+                limits = replace(limits, **{field_name: convert(value) or None})
+        return replace(limits, **{name: value or None for name, value in overrides.items() if value is not None})
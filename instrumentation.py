@@ -0,0 +1,208 @@
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+from document_model import ParsedDocument
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsSink:
+    """Receives one event per finished stage"""
+
+    def emit(self, event: Dict):
+        raise NotImplementedError
+
+
+class LogSink(MetricsSink):
+    """Writes each stage event as a structured JSON log line"""
+
+    def __init__(self, log: logging.Logger = None, level: int = logging.INFO):
+        self.log = log or logging.getLogger('resume_extractor.metrics')
+        self.level = level
+
+    def emit(self, event: Dict):
+        self.log.log(self.level, json.dumps(event, sort_keys=True))
+
+
+class CollectingSink(MetricsSink):
+    """Keeps events in memory, e.g. to ship them from a worker process to its parent"""
+
+    def __init__(self):
+        self.events: List[Dict] = []
+
+    def emit(self, event: Dict):
+        self.events.append(event)
+
+
+class PrometheusSink(MetricsSink):
+    """Aggregates stage events and renders them in the Prometheus text format"""
+
+    # (metric suffix, event field, type, help)
+    COUNTERS = [
+        ('calls_total', None, 'Stage invocations'),
+        ('errors_total', 'error', 'Stage invocations that raised'),
+        ('wall_seconds_total', 'wall_seconds', 'Wall time spent in the stage'),
+        ('cpu_seconds_total', 'cpu_seconds', 'CPU time spent in the stage'),
+        ('pages_total', 'pages', 'Pages processed by the stage'),
+        ('chars_total', 'chars', 'Characters of text processed by the stage'),
+    ]
+
+    def __init__(self, prefix: str = 'resume_extractor_stage'):
+        self.prefix = prefix
+        self._totals: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._lock = threading.Lock()
+
+    def emit(self, event: Dict):
+        with self._lock:
+            totals = self._totals[event['stage']]
+            totals['calls_total'] += 1
+            for suffix, field, _ in self.COUNTERS[1:]:
+                totals[suffix] += float(event.get(field) or 0)
+            if event.get('peak_bytes') is not None:
+                totals['peak_bytes'] = max(totals['peak_bytes'], event['peak_bytes'])
+
+    def render(self) -> str:
+        with self._lock:
+            stages = sorted(self._totals.items())
+            lines = []
+            for suffix, _, help_text in self.COUNTERS:
+                name = f"{self.prefix}_{suffix}"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for stage, totals in stages:
+                    lines.append(f'{name}{{stage="{stage}"}} {totals[suffix]:g}')
+            name = f"{self.prefix}_peak_bytes"
+            lines.append(f"# HELP {name} Largest peak allocation seen in the stage (tracemalloc)")
+            lines.append(f"# TYPE {name} gauge")
+            for stage, totals in stages:
+                if 'peak_bytes' in totals:
+                    lines.append(f'{name}{{stage="{stage}"}} {totals["peak_bytes"]:g}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str):
+        with open(path, 'w') as f:
+            f.write(self.render())
+
+
+class Instrumentation:
+    """Times stages and forwards the measurements to the registered sinks
+
+    With no sinks registered, stages run without any measurement overhead.
+    Peak allocation uses tracemalloc, which slows Python down noticeably, so
+    it is only recorded when trace_memory is set (or RESUME_TRACE_MEMORY=1).
+    """
+
+    def __init__(self):
+        self.sinks: List[MetricsSink] = []
+        self.trace_memory = os.environ.get('RESUME_TRACE_MEMORY') == '1'
+        self._local = threading.local()
+
+    def add_sink(self, sink: MetricsSink) -> MetricsSink:
+        self.sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink: MetricsSink):
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+
+    def emit(self, event: Dict):
+        for sink in list(self.sinks):
+            try:
+                sink.emit(event)
+            except Exception as e:
+                logger.warning(f"Metrics sink failed: {str(e)}")
+
+    @contextlib.contextmanager
+    def collect(self):
+        """Collect the events of the enclosed stages into a list"""
+        sink = self.add_sink(CollectingSink())
+        try:
+            yield sink.events
+        finally:
+            self.remove_sink(sink)
+
+    @contextlib.contextmanager
+    def stage(self, name: str, **labels):
+        """Measure the enclosed block; the yielded dict may be updated with pages/chars"""
+        info = dict(labels)
+        if not self.sinks:
+            yield info
+            return
+
+        # Nested stages: the inner stage resets the tracemalloc peak, so it hands its peak to the outer one
+        stack = self._local.__dict__.setdefault('peaks', [])
+        trace = self.trace_memory
+        if trace:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            stack.append(0)
+
+        error = False
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield info
+        except BaseException:
+            error = True
+            raise
+        finally:
+            event = {
+                'stage': name,
+                'wall_seconds': time.perf_counter() - wall_start,
+                'cpu_seconds': time.thread_time() - cpu_start,
+                'error': error,
+            }
+            if trace:
+                child_peak = stack.pop()
+                peak = max(tracemalloc.get_traced_memory()[1], child_peak) - start_bytes
+                event['peak_bytes'] = max(0, peak)
+                if stack:
+                    stack[-1] = max(stack[-1], start_bytes + event['peak_bytes'])
+                tracemalloc.reset_peak()
+            event.update(info)
+            self.emit(event)
+
+
+def _describe(info: Dict, args: tuple, result):
+    """Fill pages and chars from the documents or text a stage received or returned"""
+    for value in (result,) + args:
+        if isinstance(value, ParsedDocument):
+            info.setdefault('pages', value.page_count)
+            info.setdefault('chars', len(value.text))
+            return
+    if isinstance(result, dict) and isinstance(result.get('text'), str):
+        info.setdefault('chars', len(result['text']))
+        return
+    for value in args:
+        if isinstance(value, str):
+            info.setdefault('chars', len(value))
+            return
+
+
+def instrumented(stage: str) -> Callable:
+    """Method decorator recording wall time, CPU time, peak allocation, pages and text size of a stage"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics.sinks:
+                return func(*args, **kwargs)
+            with metrics.stage(stage) as info:
+                result = func(*args, **kwargs)
+                _describe(info, args[1:] + tuple(kwargs.values()), result)
+                return result
+        return wrapper
+    return decorator
+
+
+# Shared instrumentation for the whole process
+metrics = Instrumentation()
@@ -0,0 +1,163 @@
+"""Rank a candidate pool against a job description by weighted skill overlap
+
+    python job_matcher.py export/ job.txt -k 20 --weight technical_skills=2 --weight soft_skills=0.5
+
+The pool is an export written by ``batch.py --export``. The job description
+goes through the same skill matcher as resumes; both sides become vectors
+over the skills.json vocabulary and every candidate is scored with one
+sparse matrix-vector product.
+"""
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from export import build_skill_matrix, load_export
+from skill_automaton import get_skill_automaton
+from skill_index import top_positions
+from skills_db import build_category_index, load_skills_db, skill_vocabulary
+
+
+def job_skills(text: str) -> List[str]:
+    """Lowercase skills mentioned anywhere in a job description
+
+    Unlike resumes, job descriptions list requirements throughout, so the
+    whole text is matched rather than a skills section.
+    """
+    automaton = get_skill_automaton()
+    found = []
+    for start, end, (category, skill) in automaton.find(' '.join(text.lower().split())):
+        if skill.lower() not in found:
+            found.append(skill.lower())
+    return found
+
+
+def skill_weights(vocabulary: List[str], category_weights: Optional[Dict[str, float]] = None,
+                  skills_db: Optional[Dict] = None) -> np.ndarray:
+    """Weight of each vocabulary skill: the largest weight among its categories, 1 by default
+
+    A weight for a top-level category, e.g. technical_skills, also applies
+    to its nested categories.
+    """
+    weights = np.ones(len(vocabulary), dtype=np.float32)
+    if not category_weights:
+        return weights
+    categories = build_category_index(skills_db if skills_db is not None else load_skills_db())
+    for column, skill in enumerate(vocabulary):
+        values = [
+            category_weights.get(category, category_weights.get(category.split(' - ')[0]))
+            for category in categories.get(skill, [])
+        ]
+        values = [value for value in values if value is not None]
+        if values:
+            weights[column] = max(values)
+    return weights
+
+
+class JobMatcher:
+    """Scores every candidate of a pool against a job's skills in one matrix operation
+
+    The pool is a candidate x skill matrix (scipy.sparse CSR or
+    export.SkillMatrix) whose columns follow the vocabulary. A candidate's
+    score is the weighted share of the job's skills they list.
+    """
+
+    def __init__(self, matrix, vocabulary: List[str], documents: Optional[List[Dict]] = None,
+                 category_weights: Optional[Dict[str, float]] = None):
+        self.matrix = matrix
+        self.vocabulary = vocabulary
+        self.documents = documents
+        self.column_of = {skill: column for column, skill in enumerate(vocabulary)}
+        self.weights = skill_weights(vocabulary, category_weights)
+
+    @classmethod
+    def from_records(cls, records: List[Dict], category_weights: Optional[Dict[str, float]] = None) -> 'JobMatcher':
+        vocabulary = skill_vocabulary(load_skills_db())
+        documents = [{'file': record.get('file', ''), 'name': record.get('name', '')} for record in records]
+        return cls(build_skill_matrix(records, vocabulary), vocabulary, documents, category_weights)
+
+    @classmethod
+    def from_export(cls, directory: str, category_weights: Optional[Dict[str, float]] = None) -> 'JobMatcher':
+        frame, matrix, vocabulary = load_export(directory)
+        documents = frame[['file', 'name']].fillna('').to_dict('records')
+        return cls(matrix, vocabulary, documents, category_weights)
+
+    def job_vector(self, skills: List[str]) -> np.ndarray:
+        """Weighted indicator vector of the job's skills over the vocabulary"""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        columns = [self.column_of[skill.lower()] for skill in skills if skill.lower() in self.column_of]
+        vector[columns] = self.weights[columns]
+        return vector
+
+    def scores(self, vector: np.ndarray) -> np.ndarray:
+        """Weighted share of the job's skills each candidate lists, between 0 and 1"""
+        total = float(vector.sum())
+        if not total:
+            return np.zeros(self.matrix.shape[0], dtype=np.float32)
+        return np.asarray(self.matrix.dot(vector)).ravel() / total
+
+    def rank(self, job_description: str, k: int = 10) -> List[Dict]:
+        """Top-k candidates for a job description, with the job skills each one has and lacks"""
+        return self.rank_skills(job_skills(job_description), k)
+
+    def rank_skills(self, skills: List[str], k: int = 10) -> List[Dict]:
+        """Top-k candidates for an already extracted list of job skills"""
+        vector = self.job_vector(skills)
+        scores = self.scores(vector)
+        job_columns = np.flatnonzero(vector)
+        indices, indptr = self.matrix.indices, self.matrix.indptr
+        results = []
+        for row in top_positions(scores, k):
+            row_columns = indices[indptr[row]:indptr[row + 1]]
+            has = np.isin(job_columns, row_columns)
+            result = {
+                'id': int(row),
+                'score': round(float(scores[row]), 4),
+                'matched': [self.vocabulary[column] for column in job_columns[has]],
+                'missing': [self.vocabulary[column] for column in job_columns[~has]],
+            }
+            if self.documents is not None:
+                result.update(self.documents[row])
+            results.append(result)
+        return results
+
+
+def _parse_weight(value: str):
+    category, _, weight = value.partition('=')
+    try:
+        return category.strip(), float(weight)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected CATEGORY=WEIGHT, got {value!r}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rank exported candidates against a job description")
+    parser.add_argument('export', help="Directory written by batch.py --export")
+    parser.add_argument('job', help="Job description text file, or - for stdin")
+    parser.add_argument('-k', type=int, default=10, help="Number of candidates (default: 10)")
+    parser.add_argument('--weight', type=_parse_weight, action='append', default=[],
+                        metavar='CATEGORY=WEIGHT', help="Weight for a skills.json category (default: 1)")
+    args = parser.parse_args(argv)
+
+    if args.job == '-':
+        text = sys.stdin.read()
+    else:
+        with open(args.job, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+    skills = job_skills(text)
+    if not skills:
+        print("No known skills found in the job description", file=sys.stderr)
+        return 1
+    print(f"Job skills: {', '.join(skills)}")
+
+    matcher = JobMatcher.from_export(args.export, dict(args.weight))
+    for result in matcher.rank_skills(skills, args.k):
+        print(f"{result['score']:.2f}  {result['name'] or '-':30}  {result['file']}")
+        print(f"      missing: {', '.join(result['missing']) or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from instrumentation import metrics
+
+DEFAULT_MODEL = 'en_core_web_sm'
+
+# Trained components of the en_core_web_* pipelines. Anything a stage doesn't
+# ask for is excluded at load time, so its weights are never read into memory.
+PIPELINE_COMPONENTS = ('tok2vec', 'tagger', 'parser', 'senter', 'attribute_ruler', 'lemmatizer', 'ner')
+
+# Rule-based sentence splitter used instead of the dependency parser
+LINE_SENTENCIZER = 'line_sentencizer'
+
+_SENTENCE_END = frozenset(('.', '!', '?'))
+
+
+def _register_line_sentencizer():
+    """Register a sentencizer that also starts a new sentence on every line"""
+    from spacy.language import Language
+
+    if Language.has_factory(LINE_SENTENCIZER):
+        return
+
+    @Language.component(LINE_SENTENCIZER)
+    def line_sentencizer(doc):
+        start = True
+        for token in doc:
+            token.is_sent_start = start
+            start = (token.is_space and '\n' in token.text) or token.text in _SENTENCE_END
+        return doc
+
+
+def _load_spacy_model(name: str, components: Optional[Tuple[str, ...]] = None):
+    """Load a spaCy pipeline, keeping only the requested components when given"""
+    import spacy
+
+    if components is None:
+        return spacy.load(name)
+
+    exclude = [component for component in PIPELINE_COMPONENTS if component not in components]
+    nlp = spacy.load(name, exclude=exclude)
+    if LINE_SENTENCIZER in components:
+        _register_line_sentencizer()
+        nlp.add_pipe(LINE_SENTENCIZER, first=True)
+    return nlp
+
+
+def _model_key(name: str, components: Optional[Iterable[str]]) -> Tuple[str, Optional[Tuple[str, ...]]]:
+    return name, tuple(sorted(set(components))) if components is not None else None
+
+
+def _stats_label(key) -> str:
+    name, components = key
+    return name if components is None else f"{name}[{','.join(components) or 'tokenizer'}]"
+
+
+class ModelRegistry:
+    """Process-wide registry that loads each NLP model once, on first use
+
+    Stages pass the components they need; each distinct component set is
+    loaded once with everything else excluded. ``components=None`` gives the
+    full pipeline and ``components=()`` a tokenizer-only pipeline.
+    """
+
+    def __init__(self, loader: Callable[[str, Optional[Tuple[str, ...]]], Any] = _load_spacy_model):
+        self._loader = loader
+        self._models: Dict[tuple, Any] = {}
+        self._errors: Dict[tuple, Exception] = {}
+        self._stats: Dict[tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str = DEFAULT_MODEL, components: Optional[Iterable[str]] = None):
+        """Return the shared instance of a model, loading it on first use"""
+        key = _model_key(name, components)
+        model = self._models.get(key)
+        if model is not None:
+            self._stats[key]['hits'] += 1
+            return model
+
+        with self._lock:
+            # Another thread may have finished loading while we waited
+            if key in self._models:
+                self._stats[key]['hits'] += 1
+                return self._models[key]
+
+            # Don't retry a model that already failed to load in this process
+            if key in self._errors:
+                raise self._errors[key]
+
+            start = time.perf_counter()
+            try:
+                with metrics.stage('load_model', model=_stats_label(key)):
+                    model = self._loader(*key)
+            except Exception as e:
+                self._errors[key] = e
+                self._stats[key] = {
+                    'loaded': False,
+                    'load_seconds': time.perf_counter() - start,
+                    'hits': 0,
+                    'error': str(e)
+                }
+                raise
+
+            self._models[key] = model
+            self._stats[key] = {
+                'loaded': True,
+                'load_seconds': time.perf_counter() - start,
+                'hits': 0,
+                'error': None,
+                'pipeline': list(getattr(model, 'pipe_names', []))
+            }
+            return model
+
+    def get_or_none(self, name: str = DEFAULT_MODEL, components: Optional[Iterable[str]] = None):
+        """Return the shared model, or None if it cannot be loaded"""
+        already_failed = _model_key(name, components) in self._errors
+        try:
+            return self.get(name, components)
+        except Exception as e:
+            # Warn once per process rather than on every call
+            if not already_failed:
+                print(f"Warning: Could not load spaCy model: {str(e)}")
+            return None
+
+    def is_loaded(self, name: str = DEFAULT_MODEL, components: Optional[Iterable[str]] = None) -> bool:
+        return _model_key(name, components) in self._models
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Load time, reuse count, components and load errors for every requested pipeline"""
+        return {_stats_label(key): dict(values) for key, values in self._stats.items()}
+
+    def clear(self):
+        """Drop loaded models so they are reloaded on next use"""
+        with self._lock:
+            self._models.clear()
+            self._errors.clear()
+            self._stats.clear()
+
+
+# Shared registry for the whole process
+registry = ModelRegistry()
+
+
+def get_nlp(name: str = DEFAULT_MODEL, components: Optional[Iterable[str]] = None):
+    """Return the process-wide spaCy pipeline, or None if it cannot be loaded"""
+    return registry.get_or_none(name, components)
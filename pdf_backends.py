@@ -0,0 +1,334 @@
+import logging
+import os
+import time
+from typing import Iterator, Optional, Tuple
+
+from document_model import Page, ParsedDocument, Word
+from extraction_limits import PAGES, SECONDS
+from text_normalizer import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Cheapest first: PyPDF2 text, pdfplumber text, pdfplumber with layout analysis
+BACKENDS = ('pypdf2', 'text', 'layout')
+
+# Most single-column resumes read fine without layout analysis
+AUTO_CHAIN = ('text', 'layout')
+
+# Deployment-wide default, e.g. RESUME_PDF_BACKEND=pypdf2,layout
+BACKEND_ENV = 'RESUME_PDF_BACKEND'
+
+# A page whose lines average more characters than this lost its line breaks
+MAX_CHARS_PER_LINE = 300
+# Share of single-letter tokens above which words were split into characters
+BROKEN_WORD_RATIO = 0.25
+MIN_TOKENS_FOR_RATIO = 20
+# Empty vertical band, in points, that separates two columns
+MIN_GUTTER_WIDTH = 12
+# Words and share of words each column needs before a page counts as multi-column
+MIN_COLUMN_WORDS = 20
+MIN_COLUMN_SHARE = 0.2
+
+
+def resolve_backend(backend: Optional[str] = None) -> Tuple[str, ...]:
+    """Turn 'auto', a backend name or a comma separated escalation chain into backend names
+
+    Without an explicit backend, RESUME_PDF_BACKEND is used, then 'auto'.
+    """
+    spec = (backend or os.environ.get(BACKEND_ENV) or 'auto').strip().lower()
+    if spec == 'auto':
+        return AUTO_CHAIN
+    chain = tuple(name.strip() for name in spec.split(',') if name.strip())
+    if not chain or any(name not in BACKENDS for name in chain):
+        raise ValueError(f"Unknown PDF backend: {spec} (use auto or a comma separated list of {', '.join(BACKENDS)})")
+    return chain
+
+
+def find_column_split(page: Page) -> Optional[float]:
+    """Return the x position of a vertical gutter splitting the page into two columns, or None"""
+    words = page.words
+    if len(words) < 2 * MIN_COLUMN_WORDS or not page.width:
+        return None
+
+    # Words covering each point across the middle half of the page
+    low, high = int(page.width * 0.25), int(page.width * 0.75)
+    coverage = [0] * (high - low + 1)
+    for word in words:
+        start, end = max(int(word.x0), low), min(int(word.x1) + 1, high)
+        if start < end:
+            coverage[start - low] += 1
+            coverage[end - low] -= 1
+    # A few full-width header lines may cross the gutter
+    allowed = max(1, len(words) // 50)
+
+    best = (0, 0)
+    run_start = None
+    running = 0
+    for offset, delta in enumerate(coverage):
+        running += delta
+        if running <= allowed and offset < len(coverage) - 1:
+            if run_start is None:
+                run_start = offset
+        elif run_start is not None:
+            if offset - run_start > best[1] - best[0]:
+                best = (run_start, offset)
+            run_start = None
+    if best[1] - best[0] < MIN_GUTTER_WIDTH:
+        return None
+
+    left_edge, right_edge = low + best[0], low + best[1]
+    left = sum(1 for word in words if word.x1 <= left_edge)
+    right = sum(1 for word in words if word.x0 >= right_edge)
+    # Right-aligned dates next to single-column text are not a second column
+    if min(left, right) < max(MIN_COLUMN_WORDS, MIN_COLUMN_SHARE * len(words)):
+        return None
+    return (left_edge + right_edge) / 2
+
+
+def layout_issue(page: Page) -> Optional[str]:
+    """Return why a page's cheap extraction looks wrong, or None if it can be used as is"""
+    text = page.text
+    if not text:
+        # pdfplumber found words the text-only pass did not return
+        return 'no text' if page.words else None
+
+    if len(text) / (text.count('\n') + 1) > MAX_CHARS_PER_LINE:
+        return 'too few lines'
+
+    tokens = text.split()
+    if len(tokens) >= MIN_TOKENS_FOR_RATIO:
+        single = sum(1 for token in tokens if len(token) == 1 and token.isalpha())
+        if single / len(tokens) > BROKEN_WORD_RATIO:
+            return 'broken words'
+
+    if find_column_split(page) is not None:
+        return 'multiple columns'
+    return None
+
+
+def _centered_in(region: Tuple[float, float, float, float]):
+    """Object filter keeping characters whose center lies in the region, so none is read twice or dropped"""
+    x0, top, x1, bottom = region
+
+    def test(obj) -> bool:
+        try:
+            x = (obj['x0'] + obj['x1']) / 2
+            y = (obj['top'] + obj['bottom']) / 2
+        except KeyError:
+            return False
+        return x0 <= x < x1 and top <= y < bottom
+    return test
+
+
+class PdfSource:
+    """One PDF opened lazily with each library, so a page can be re-read by a costlier backend"""
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+        self._pdf = None
+        self._file = None
+        self._reader = None
+        # pdfplumber page currently being read, with its words
+        self._page_index = None
+        self._page = None
+        self._words = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._release_page()
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._reader = None
+
+    @property
+    def pdf(self):
+        if self._pdf is None:
+            # Imported on first use to keep startup fast
+            import pdfplumber
+            self._pdf = pdfplumber.open(self.pdf_path)
+        return self._pdf
+
+    @property
+    def reader(self):
+        if self._reader is None:
+            import PyPDF2
+            self._file = open(self.pdf_path, 'rb')
+            try:
+                self._reader = PyPDF2.PdfReader(self._file)
+            except Exception:
+                self._file.close()
+                self._file = None
+                raise
+        return self._reader
+
+    def describe(self, backend: str) -> Tuple[int, dict]:
+        """Page count and metadata, read with the library the backend uses"""
+        if backend == 'pypdf2':
+            metadata = {key.lstrip('/'): str(value) for key, value in (self.reader.metadata or {}).items()}
+            return len(self.reader.pages), metadata
+        return len(self.pdf.pages), dict(self.pdf.metadata or {})
+
+    def extract(self, backend: str, index: int) -> Page:
+        """Read one page with the given backend"""
+        if backend == 'pypdf2':
+            page = self.reader.pages[index]
+            box = page.mediabox
+            return Page(
+                number=index + 1,
+                text=normalize_text(page.extract_text()),
+                width=float(box.width),
+                height=float(box.height),
+                backend=backend
+            )
+
+        page = self._plumber_page(index)
+        result = Page(
+            number=index + 1,
+            text="",
+            words=self._page_words(),
+            width=float(page.width),
+            height=float(page.height),
+            backend=backend
+        )
+        if backend == 'layout':
+            page_text = self._layout_text(page, find_column_split(result))
+        else:
+            page_text = page.extract_text()
+        result.text = normalize_text(page_text)
+        return result
+
+    def _layout_text(self, page, split: Optional[float]) -> str:
+        """Layout-aware text, reading two-column pages one column after the other"""
+        try:
+            if split is None:
+                return page.extract_text(layout=True)
+
+            # Everything above the right column, e.g. a full-width header, is read first
+            x0, top, x1, bottom = page.bbox
+            split = min(max(split, x0), x1)
+            columns_top = min(max(min(word.top for word in self._words if word.x0 >= split), top), bottom)
+            regions = [(x0, columns_top, split, bottom), (split, columns_top, x1, bottom)]
+            if columns_top > top:
+                regions.insert(0, (x0, top, x1, columns_top))
+            return '\n'.join(page.filter(_centered_in(region)).extract_text(layout=True) or '' for region in regions)
+        except Exception as e:
+            # Fallback to basic extraction if layout fails
+            return page.extract_text()
+
+    def _plumber_page(self, index: int):
+        # Escalating on the same page reuses the characters pdfplumber already parsed
+        if self._page_index != index:
+            self._release_page()
+            self._page = self.pdf.pages[index]
+            self._page_index = index
+        return self._page
+
+    def _page_words(self):
+        """Words with font size and name for the name and column heuristics"""
+        if self._words is None:
+            try:
+                self._words = [
+                    Word(
+                        text=word['text'],
+                        size=float(word.get('size', 0.0)),
+                        fontname=word.get('fontname', ''),
+                        x0=float(word.get('x0', 0.0)),
+                        top=float(word.get('top', 0.0)),
+                        x1=float(word.get('x1', 0.0))
+                    )
+                    for word in self._page.extract_words(extra_attrs=['size', 'fontname'])
+                ]
+            except Exception as e:
+                print(f"Warning: Failed to extract words: {str(e)}")
+                self._words = []
+        return self._words
+
+    def _release_page(self):
+        # Release pdfplumber's cached layout objects for pages already consumed
+        if self._page is not None:
+            self._page.flush_cache()
+        self._page_index = None
+        self._page = None
+        self._words = None
+
+
+def _error_fallbacks(chain: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Backends to try when every backend in the chain raised on a page"""
+    return tuple(name for name in ('pypdf2', 'text') if name not in chain)
+
+
+def extract_page(source: PdfSource, index: int, chain: Tuple[str, ...]) -> Optional[Page]:
+    """Read a page with the first backend in the chain whose output passes the quality checks"""
+    page = None
+    for position, backend in enumerate(chain):
+        try:
+            candidate = source.extract(backend, index)
+        except Exception as e:
+            print(f"Warning: {backend} backend failed on page {index + 1}: {str(e)}")
+            continue
+        page = candidate
+        if position == len(chain) - 1:
+            break
+        issue = layout_issue(page)
+        if issue is None:
+            break
+        logger.debug(f"Page {index + 1}: {issue}, escalating from {backend}")
+
+    if page is not None:
+        return page
+
+    for backend in _error_fallbacks(chain):
+        try:
+            return source.extract(backend, index)
+        except Exception as e:
+            print(f"Warning: {backend} backend failed on page {index + 1}: {str(e)}")
+    return None
+
+
+def iter_pages(pdf_path: str, document: ParsedDocument, backend: Optional[str] = None,
+               max_pages: Optional[int] = None, deadline: Optional[float] = None) -> Iterator[Page]:
+    """Yield pages read with the cheapest backend that gives usable text
+
+    Sets the document's metadata, the limits that cut it short and its
+    backend, which lists every backend that contributed a page, e.g. 'text'
+    or 'text+layout'. After the first page, parsing stops before the next
+    page once the time.monotonic() deadline has passed.
+    """
+    chain = resolve_backend(backend)
+    with PdfSource(pdf_path) as source:
+        page_count = None
+        for name in chain + _error_fallbacks(chain):
+            try:
+                page_count, document.metadata = source.describe(name)
+                break
+            except Exception as e:
+                print(f"Warning: {name} backend could not open the PDF: {str(e)}")
+        if page_count is None:
+            raise ValueError(f"Could not read PDF: {pdf_path}")
+
+        if max_pages and page_count > max_pages:
+            document.hit_limit(PAGES)
+            page_count = max_pages
+
+        used = []
+        for index in range(page_count):
+            # The first page is always read so the contact details survive
+            if index and deadline is not None and time.monotonic() > deadline:
+                document.hit_limit(SECONDS)
+                return
+            page = extract_page(source, index, chain)
+            if page is None:
+                continue
+            if page.backend not in used:
+                used.append(page.backend)
+                document.backend = '+'.join(used)
+            yield page
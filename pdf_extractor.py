@@ -1,55 +1,69 @@
 import os
 import re
-import json
 import logging
-from typing import Dict, List, Tuple
-import PyPDF2
-import pdfplumber
-import spacy
-from spacy.matcher import Matcher
-import nltk
-from nltk.corpus import stopwords
-
-# Set up logging
+import time
+from dataclasses import replace
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import document_formats
+import pdf_backends
+from contact_scanner import HEADER_CHARS, scan_contacts
+from document_model import Page, ParsedDocument
+from extraction_limits import BYTES, CHARS, SECONDS, DocumentTooLarge, ExtractionLimits
+from instrumentation import instrumented
+from model_registry import LINE_SENTENCIZER, get_nlp
+from result_cache import ResultCache
+from sections import find_sections
+from skill_automaton import SkillAutomaton, compile_skills, get_skill_automaton
+from skills_db import (diff_skills_db, load_skills_db, load_skills_snapshot, save_skills_snapshot,
+                       skills_db_version)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load skills data
-with open('skills.json', 'r') as f:
-    SKILLS_DATA = json.load(f)
+# spaCy components extract_experience needs: sentence boundaries and ORG entities
+EXPERIENCE_COMPONENTS = ('ner', LINE_SENTENCIZER)
+
+# Bump when a change to the extractors alters their results, so cached results are not reused
+EXTRACTOR_VERSION = '5'
+
+
+def cache_version(backend: Optional[str] = None, limits: Optional[ExtractionLimits] = None) -> str:
+    """Version tag for cached results: extractor version, PDF backend and truncation limits
+
+    The skills database is not part of it: cached results keep their text
+    and are brought up to date with skills.json by refresh_skills.
+    """
+    limits = limits or ExtractionLimits()
+    return (f"{EXTRACTOR_VERSION}:{','.join(pdf_backends.resolve_backend(backend))}"
+            f":{limits.max_pages}:{limits.max_chars}")
+
 
 class PDFExtractor:
-    def __init__(self):
-        """Initialize the PDF extractor"""
+    def __init__(self, cache: Optional[ResultCache] = None, max_pages: Optional[int] = None,
+                 backend: Optional[str] = None, limits: Optional[ExtractionLimits] = None):
+        """Initialize the PDF extractor, optionally with a result cache, resource limits and a PDF backend
+
+        max_pages, when given, overrides the page limit of limits.
+        """
+        self.pdf_path = None
+        self.document = None
+        self.cache = cache
+        self.limits = limits or ExtractionLimits()
+        if max_pages is not None:
+            self.limits = replace(self.limits, max_pages=max_pages)
+        # (text, contacts) of the last contact scan, shared by the name, email and phone stages
+        self._contacts = None
+        # (text, sections) of the last segmentation, shared the same way
+        self._sections = None
+        # Automaton of the skills changed since a skills.json version, by version
+        self._skill_changes: Dict[Tuple[str, str], Optional[SkillAutomaton]] = {}
+        # Fail on a misconfigured backend now rather than on the first document
+        self.backend = ','.join(pdf_backends.resolve_backend(backend))
+        
         try:
-            # Initialize NLP
-            try:
-                import spacy
-                self.nlp = spacy.load('en_core_web_sm')
-            except Exception as e:
-                print(f"Warning: Could not load spacy model: {str(e)}")
-                self.nlp = None
-            
-            # Initialize NLTK
-            try:
-                import nltk
-                nltk.download('punkt', quiet=True)
-                nltk.download('stopwords', quiet=True)
-                nltk.download('averaged_perceptron_tagger', quiet=True)
-                nltk.download('wordnet', quiet=True)
-            except Exception as e:
-                print(f"Warning: Could not download NLTK data: {str(e)}")
-            
-            # Initialize matcher if NLP is available
-            if self.nlp:
-                try:
-                    from spacy.matcher import Matcher
-                    self.matcher = Matcher(self.nlp.vocab)
-                except Exception as e:
-                    print(f"Warning: Could not initialize matcher: {str(e)}")
-                    self.matcher = None
+            # The spaCy model is loaded lazily through the shared registry,
+            # and nothing here needs the network
             
             # Initialize skill classifier
             try:
@@ -62,155 +76,168 @@ class PDFExtractor:
 
         except Exception as e:
             print(f"Warning: Could not load NLP models: {str(e)}")
-            self.nlp = None
 
-    def extract_text(self, pdf_path: str) -> str:
-        """Extract text from a PDF file with multiple methods and clean formatting"""
+    @property
+    def max_pages(self) -> Optional[int]:
+        return self.limits.max_pages
+
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline with only the experience stage's components, loaded on first use"""
+        return get_nlp(components=EXPERIENCE_COMPONENTS)
+
+    @instrumented('parse_document')
+    def parse_document(self, pdf_path: str, max_pages: Optional[int] = None,
+                       backend: Optional[str] = None) -> ParsedDocument:
+        """Parse a PDF, DOCX or text file once into a document model shared by every extractor"""
+        document = ParsedDocument(path=pdf_path)
+        for page in self.iter_pages(pdf_path, max_pages=max_pages, document=document, backend=backend):
+            document.add_page(page)
+        
+        self.pdf_path = pdf_path
+        self.document = document
+        return document
+
+    def iter_pages(self, pdf_path: str, max_pages: Optional[int] = None,
+                   document: Optional[ParsedDocument] = None, backend: Optional[str] = None) -> Iterator[Page]:
+        """Stream parsed pages one at a time so consumers can stop early
+
+        The format follows the file extension. For PDFs, the backend ('auto',
+        'pypdf2', 'text', 'layout' or a comma separated escalation chain)
+        overrides the extractor's backend for this call; DOCX and text files
+        are read directly, as one page. Files over the byte limit raise
+        DocumentTooLarge; the page, character and time limits end the stream
+        early and are recorded on the document.
+        """
+        if not pdf_path or not os.path.exists(pdf_path):
+            raise ValueError(f"Invalid PDF path: {pdf_path}")
+        file_format = document_formats.document_format(pdf_path)
+        
+        limits = self.limits
+        if max_pages is None:
+            max_pages = limits.max_pages
+        if document is None:
+            document = ParsedDocument(path=pdf_path)
+        
+        # Reject oversized files before any parser reads them into memory
+        size = os.path.getsize(pdf_path)
+        if limits.max_bytes and size > limits.max_bytes:
+            document.hit_limit(BYTES)
+            raise DocumentTooLarge(
+                BYTES, f"File is {size / (1024 * 1024):.1f} MB, over the {limits.max_bytes / (1024 * 1024):g} MB limit"
+            )
+        
+        deadline = time.monotonic() + limits.max_seconds if limits.max_seconds else None
+        remaining = limits.max_chars
+        if file_format == 'pdf':
+            pages = pdf_backends.iter_pages(pdf_path, document, backend or self.backend, max_pages, deadline)
+        else:
+            pages = document_formats.iter_pages(pdf_path, document, file_format)
+        for page in pages:
+            if remaining is not None:
+                if len(page.text) > remaining:
+                    # Keep the text up to the limit and stop parsing
+                    page.text = page.text[:max(remaining, 0)]
+                    document.hit_limit(CHARS)
+                    if page.text:
+                        yield page
+                    return
+                # Pages are joined with a newline
+                remaining -= len(page.text) + 1
+            yield page
+
+    def extract_text(self, pdf_path: Union[str, ParsedDocument]) -> str:
+        """Extract text from a PDF, DOCX or text file, or an already parsed document"""
         try:
-            if not pdf_path or not os.path.exists(pdf_path):
-                raise ValueError(f"Invalid PDF path: {pdf_path}")
+            if isinstance(pdf_path, ParsedDocument):
+                self.document = pdf_path
+                return pdf_path.text
             
-            # Try pdfplumber first
-            try:
-                text = ""
-                with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages:
-                        try:
-                            # Extract text with layout analysis
-                            page_text = page.extract_text(layout=True)
-                            
-                            # Clean up text while preserving important formatting
-                            if page_text:
-                                # Remove excessive newlines but preserve paragraphs
-                                page_text = re.sub(r'\n\s*\n\s*\n', '\n\n', page_text)  # Remove triple newlines
-                                page_text = re.sub(r'\n\s*\n', '\n', page_text)  # Normalize double newlines
-                                
-                                # Remove extra spaces but preserve single spaces
-                                page_text = re.sub(r'\s{2,}', ' ', page_text)  # Remove multiple spaces
-                                
-                                # Remove empty lines but preserve paragraph breaks
-                                page_text = '\n'.join(line for line in page_text.splitlines() if line.strip() or line == '')
-                                
-                                # Preserve potential names and proper nouns
-                                page_text = re.sub(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', r'\1', page_text)
-                                
-                                text += page_text + "\n"
-                        except Exception as e:
-                            # Fallback to basic extraction if layout fails
-                            page_text = page.extract_text()
-                            if page_text:
-                                page_text = re.sub(r'\n\s*\n\s*\n', '\n\n', page_text)
-                                page_text = re.sub(r'\n\s*\n', '\n', page_text)
-                                page_text = re.sub(r'\s{2,}', ' ', page_text)
-                                page_text = '\n'.join(line for line in page_text.splitlines() if line.strip() or line == '')
-                                page_text = re.sub(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', r'\1', page_text)
-                                
-                                text += page_text + "\n"
-                
-                # Final cleanup while preserving structure
-                text = text.strip()  # Remove leading/trailing whitespace
-                text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)  # Remove triple newlines
-                text = re.sub(r'\n\s*\n', '\n', text)  # Normalize double newlines
-                
-                # Preserve potential names in the final text
-                text = re.sub(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', r'\1', text)
-                
-                return text
-            
-            except Exception as e:
-                print(f"Warning: pdfplumber failed: {str(e)}")
-                try:
-                    # Fallback to PyPDF2
-                    with open(pdf_path, 'rb') as file:
-                        try:
-                            pdf_reader = PyPDF2.PdfReader(file)
-                            text = ""
-                            for page in pdf_reader.pages:
-                                try:
-                                    page_text = page.extract_text()
-                                    if page_text:
-                                        # Clean up text
-                                        page_text = re.sub(r'\n\s*\n', '\n', page_text)
-                                        page_text = re.sub(r'\s+', ' ', page_text)
-                                        page_text = '\n'.join(line for line in page_text.splitlines() if line.strip())
-                                        
-                                        text += page_text + "\n"
-                                except Exception as e:
-                                    print(f"Warning: Failed to extract page: {str(e)}")
-                                    continue
-                            
-                            # Final cleanup
-                            text = text.strip()
-                            text = re.sub(r'\n\s*\n', '\n\n', text)
-                            
-                            return text
-                        except Exception as e:
-                            print(f"Warning: Failed to read PDF: {str(e)}")
-                            raise
-                except Exception as e:
-                    print(f"Warning: PyPDF2 failed: {str(e)}")
-                    raise
+            return self.parse_document(pdf_path).text
         except Exception as e:
             raise Exception(f"Failed to extract text: {str(e)}")
 
-    def extract_skills(self, text: str) -> List[Dict[str, List[str]]]:
-        """Extract skills from text using skills.json database"""
+    def extract_header_fields(self, pdf_path: str, max_pages: int = 1) -> Dict[str, str]:
+        """Extract name, email and phone from the first page(s) only, stopping once both contacts are found"""
+        document = ParsedDocument(path=pdf_path)
+        contacts = {}
+        for page in self.iter_pages(pdf_path, max_pages=max_pages, document=document):
+            document.add_page(page)
+            contacts = self.extract_contacts(document.text)
+            if contacts['email'] and contacts['phone']:
+                break
+        
+        return {
+            'name': self.extract_name(document.text, document),
+            'email': contacts.get('email', ""),
+            'phone': contacts.get('phone', "")
+        }
+
+    @instrumented('find_sections')
+    def find_sections(self, text: str, document: Optional[ParsedDocument] = None) -> Dict[str, Tuple[int, int]]:
+        """Character spans of the resume's sections, found once per text and shared by every extractor
+
+        The spans are also stored on the document when it is the text's source.
+        """
+        cached = self._sections
+        if cached is not None and (cached[0] is text or cached[0] == text):
+            sections = cached[1]
+        else:
+            sections = find_sections(text)
+            self._sections = (text, sections)
+        if document is not None and document.text == text:
+            document.sections = sections
+        return sections
+
+    @instrumented('extract_contacts')
+    def extract_contacts(self, text: str) -> Dict[str, str]:
+        """Extract email, phone, LinkedIn and GitHub in one scan, reusing the last scan of the same text
+
+        The scan starts with the contact section, the text above the first heading.
+        """
+        cached = self._contacts
+        if cached is not None and (cached[0] is text or cached[0] == text):
+            return dict(cached[1])
+        contact = self.find_sections(text).get('contact')
+        contacts = scan_contacts(text, min(contact[1], HEADER_CHARS) if contact else HEADER_CHARS)
+        self._contacts = (text, contacts)
+        return dict(contacts)
+
+    @instrumented('extract_skills')
+    def extract_skills(self, text: str, document: Optional[ParsedDocument] = None,
+                       section: Optional[Tuple[int, int]] = None) -> List[Dict[str, List[str]]]:
+        """Extract skills from text using skills.json database
+
+        Only the skills section is searched, or the whole text when there is none.
+        """
         try:
-            # Load skills from JSON file
-            with open('skills.json', 'r') as f:
-                skills_db = json.load(f)
+            if not text and document is not None:
+                text = document.text
+            
+            # Skills are compiled once into a multi-pattern automaton
+            automaton = get_skill_automaton()
 
             # Initialize found skills
             found_skills = []
-            lines = text.lower().split('\n')
-            
-            # Look for common skill section keywords
-            skill_keywords = ['skills', 'technical skills', 'key skills', 'expertise', 'technologies', 'technical expertise']
-            
-            # Find skill section
-            skill_section_start = None
-            for i, line in enumerate(lines):
-                if any(keyword in line for keyword in skill_keywords):
-                    skill_section_start = i
-                    break
-            
-            # If we found a skill section, only look in that section
-            if skill_section_start is not None:
-                skill_section = lines[skill_section_start:skill_section_start + 20]
-                text_to_search = ' '.join(skill_section)
-            else:
-                text_to_search = text.lower()
             
-            # Split by common separators
-            text_to_search = text_to_search.replace(',', ' ').replace('.', ' ').replace(':', ' ').replace(';', ' ')
+            # If there is a skill section, only look in that section
+            if section is None:
+                section = self.find_sections(text, document).get('skills', (0, len(text)))
+            start, end = section
             
-            # Search for skills in each category
-            for category, skills in skills_db.items():
-                category_skills = []
-                
-                for skill in skills:
-                    skill_words = skill.lower().split()
-                    
-                    # Handle multi-word skills
-                    skill_text = ' '.join(skill_words)
-                    
-                    # Check if skill exists in text
-                    if skill_text in text_to_search:
-                        category_skills.append(skill)
-                    
-                    # Also check for variations with spaces
-                    skill_variations = [''.join(skill_words), '_'.join(skill_words)]
-                    for variation in skill_variations:
-                        if variation in text_to_search:
-                            category_skills.append(skill)
-                            break
-                
-                # If we found any skills in this category
-                if category_skills:
-                    found_skills.append({
-                        "category": category,
-                        "tech_stack": list(set(category_skills))  # Remove duplicates
-                    })
+            # Collapse whitespace so multi-word skills match across line breaks
+            text_to_search = ' '.join(text[start:end].lower().split())
+            
+            # Find every skill on word boundaries in a single pass
+            skills_by_category = {}
+            for start, end, (category, skill) in automaton.find(text_to_search):
+                skills_by_category.setdefault(category, set()).add(skill)
+            
+            for category, category_skills in skills_by_category.items():
+                found_skills.append({
+                    "category": category,
+                    "tech_stack": sorted(category_skills)
+                })
             
             # Sort categories alphabetically
             found_skills.sort(key=lambda x: x["category"])
@@ -225,31 +252,83 @@ class PDFExtractor:
             print(f"Error extracting skills: {str(e)}")
             return [{"category": "Error extracting skills", "tech_stack": []}]
         
-    def extract_name(self, text: str) -> str:
+    def _changed_skills(self, version: Optional[str]) -> Optional[SkillAutomaton]:
+        """Automaton of the skills changed between a skills.json version and the current one
+
+        Returns None when the earlier version is unknown, i.e. anything may have changed.
+        """
+        current = skills_db_version()
+        if not version or self.cache is None:
+            return None
+        if (version, current) not in self._skill_changes:
+            previous = load_skills_snapshot(self.cache.snapshot_dir, version)
+            changed = None
+            if previous is not None:
+                changed = compile_skills({'changed': sorted(diff_skills_db(previous, load_skills_db()))})
+            self._skill_changes[(version, current)] = changed
+        return self._skill_changes[(version, current)]
+
+    @instrumented('refresh_skills')
+    def refresh_skills(self, record: Dict) -> bool:
+        """Bring a record's skills and summary up to date with skills.json from its stored text
+
+        Skills are matched again only when the record's skills section mentions
+        a skill that was added, removed or recategorized since the skills.json
+        version the record was made with; otherwise only that version is
+        updated. Returns whether the skills were matched again.
+        """
+        version = skills_db_version()
+        if record.get('skills_version') == version:
+            return False
+
+        text = record.get('text') or ''
+        sections = record.get('sections')
+        if sections is None:
+            sections = {section: list(span) for section, span in find_sections(text).items()}
+        start, end = sections.get('skills') or (0, len(text))
+        changed = self._changed_skills(record.get('skills_version'))
+        affected = changed is None or next(changed.find(' '.join(text[start:end].lower().split())), None) is not None
+        if affected:
+            skills = self.extract_skills(text, section=(start, end))
+            record['skills'] = skills
+            record['summary'] = self.generate_resume_summary(record.get('name', ''), skills, record.get('experience') or [])
+        record['skills_version'] = version
+        record['sections'] = sections
+        return affected
+
+    def _save_skills_snapshot(self):
+        """Keep the current skills.json next to the cache, for diffing when it changes"""
+        try:
+            save_skills_snapshot(self.cache.snapshot_dir)
+        except OSError as e:
+            print(f"Warning: Could not save skills snapshot: {str(e)}")
+
+    @instrumented('extract_name')
+    def extract_name(self, text: str, document: Optional[ParsedDocument] = None) -> str:
         """Extract name from text using multiple methods and heuristics"""
         try:
-            # Extract email first to use as reference
-            email = self.extract_email(text)
-            email_parts = email.split('@')[0].lower() if '@' in email else ''
+            document = document or self.document
+            if not text and document is not None:
+                text = document.text
             
-            # Get font sizes and formatting information
-            font_sizes = []
-            bold_texts = []
+            # Use the email from the contact scan as reference
+            email = self.extract_contacts(text)['email']
+            email_parts = email.split('@')[0].lower() if '@' in email else ''
             
-            with pdfplumber.open(self.pdf_path) as pdf:
-                page = pdf.pages[0]  # Only look at first page
-                words = page.extract_words()
-                for word in words:
-                    if 'size' in word:
-                        font_sizes.append(word['size'])
-                    if 'fontname' in word and word['fontname'].lower() == 'bold':
-                        bold_texts.append(word['text'])
+            # Get font sizes and formatting information from the parsed first page
+            words = document.first_page_words if document is not None else []
+            font_sizes = [word.size for word in words if word.size]
+            bold_texts = [word.text for word in words if word.is_bold]
             
             # Find the largest font size
             max_font_size = max(font_sizes) if font_sizes else 0
             
-            # Try to find name in the first few lines
-            lines = text.split('\n')
+            # Try to find name in the first few lines of the contact section
+            contact = self.find_sections(text, document).get('contact')
+            if contact and contact[1] > contact[0]:
+                lines = text[contact[0]:contact[1]].split('\n')
+            else:
+                lines = text.split('\n')
             
             # Check each line in the first 5 lines
             for line in lines[:5]:
@@ -273,14 +352,14 @@ class PDFExtractor:
                             return name
                     
                     # Check formatting cues
-                    if name in bold_texts:
+                    if all(part in bold_texts for part in name.split()):
                         return name
                     
                     # Check if it's in the largest font
                     if max_font_size > 0:
                         for word in words:
-                            if 'size' in word and word['size'] == max_font_size:
-                                if word['text'] in name:
+                            if word.size == max_font_size:
+                                if word.text in name:
                                     return name
             
             # If no name found yet, try to extract from email
@@ -313,31 +392,16 @@ class PDFExtractor:
             print(f"Error extracting name: {str(e)}")
             return "Candidate Name"                          
 
+    @instrumented('extract_phone')
     def extract_phone(self, text: str) -> str:
         """Extract phone number from text"""
         try:
-            # Try multiple phone number patterns
-            patterns = [
-                r'\+?[0-9]{1,3}[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',  # International format
-                r'\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',  # Local format
-                r'[0-9]{10}',  # 10-digit format
-                r'[0-9]{3}[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'  # Custom format
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text)
-                if match:
-                    phone = match.group(0)
-                    # Clean up the phone number
-                    phone = re.sub(r'[^0-9+]', '', phone)
-                    return phone
-            
-            return ""
-            
+            return self.extract_contacts(text)['phone']
         except Exception as e:
             print(f"Error extracting phone: {str(e)}")
             return ""
 
+    @instrumented('generate_resume_summary')
     def generate_resume_summary(self, name: str, skills: list, experience: list) -> str:
         """Generate a professional summary using Python's text processing"""
         try:
@@ -384,9 +448,10 @@ class PDFExtractor:
                 skill_list = list(all_skills)
                 
                 # Categorize skills
-                tech_skills = [s for s in skill_list if s.lower() in SKILLS_DATA.get("technical_skills", [])]
-                business_skills = [s for s in skill_list if s.lower() in SKILLS_DATA.get("business_skills", [])]
-                soft_skills = [s for s in skill_list if s.lower() in SKILLS_DATA.get("soft_skills", [])]
+                skills_db = load_skills_db()
+                tech_skills = [s for s in skill_list if s.lower() in skills_db.get("technical_skills", [])]
+                business_skills = [s for s in skill_list if s.lower() in skills_db.get("business_skills", [])]
+                soft_skills = [s for s in skill_list if s.lower() in skills_db.get("soft_skills", [])]
                 
                 # Add technical skills
                 if tech_skills:
@@ -422,36 +487,34 @@ class PDFExtractor:
             logger.error(f"Error generating summary: {str(e)}")
             return "Error generating summary"
 
+    @instrumented('extract_email')
     def extract_email(self, text: str) -> str:
         """Extract email address from text"""
-        # Define email pattern
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        
-        # Try to find email using pattern
-        match = re.search(email_pattern, text)
-        if match:
-            return match.group(0)
-        return ""
-
-    def extract_experience(self, text: str) -> List[Dict[str, str]]:
-        """Extract work experience using NLP and semantic analysis"""
+        return self.extract_contacts(text)['email']
+
+    @instrumented('extract_experience')
+    def extract_experience(self, text: str, document: Optional[ParsedDocument] = None) -> List[Dict[str, str]]:
+        """Extract work experience using NLP and semantic analysis
+
+        Only the experience section is parsed; without one there is nothing to extract.
+        """
         experience = []
+        if not text and document is not None:
+            text = document.text
+        
+        section = self.find_sections(text, document).get('experience')
+        if section is None:
+            return experience
+        text = text[section[0]:section[1]]
         
         try:
-            # Load spaCy model
-            import spacy
-            nlp = spacy.load('en_core_web_sm')
-            
-            # Process text with spaCy
-            doc = nlp(text)
-            
-            # Keywords to identify experience sections
-            exp_keywords = [
-                'experience', 'work experience', 'professional experience',
-                'employment history', 'career history', 'professional background',
-                'work history', 'employment', 'career',
-                'professional summary', 'career summary', 'employment details'
-            ]
+            # Get the shared spaCy model
+            nlp = self.nlp
+            if nlp is None:
+                raise OSError("spaCy model could not be loaded")
+            
+            # Process the section with spaCy, within the length the pipeline accepts
+            doc = nlp(text[:nlp.max_length])
             
             # Common position keywords
             position_keywords = [
@@ -493,29 +556,11 @@ class PDFExtractor:
 
             # Try to extract experience section using NLP
             try:
-                # Find experience section
-                exp_section = None
-                experience_section = []
-                
-                # Find experience section
-                for sent in doc.sents:
-                    if any(keyword in sent.text.lower() for keyword in exp_keywords):
-                        exp_section = sent
-                        break
+                # The section segmenter already bounded the text to the experience section
+                experience_section = list(doc.sents)
                 
-                if exp_section:
-                    # Collect all sentences in the experience section
-                    for sent in doc.sents:
-                        if exp_section.start <= sent.start <= exp_section.end:
-                            experience_section.append(sent.text)
-                        elif any(keyword in sent.text.lower() for keyword in [
-                            'education', 'skills', 'certifications', 'projects',
-                            'achievements', 'publications', 'languages', 'interests',
-                            'summary', 'objective', 'profile', 'contact', 'address'
-                        ]):
-                            break
-                    
-                    # Process the experience section line by line
+                if experience_section:
+                    # Process the experience section sentence by sentence
                     current_experience = {
                         'company': None,
                         'position': None,
@@ -534,13 +579,13 @@ class PDFExtractor:
                             return True
                         return False
                     
-                    for line in experience_section:
-                        line = line.strip()
+                    for sent in experience_section:
+                        line = sent.text.strip()
                         if not line:
                             continue
                             
-                        # Reset current experience if we find a new position
-                        if finalize_experience() and any(keyword in line.lower() for keyword in position_keywords):
+                        # Start a new experience when a complete one is followed by a new position
+                        if any(keyword in line.lower() for keyword in position_keywords) and finalize_experience():
                             current_experience = {
                                 'company': None,
                                 'position': None,
@@ -557,9 +602,9 @@ class PDFExtractor:
                                     current_experience['position'] = position
                                     break
                         
-                        # Extract company
+                        # Extract company from the entities of the document-level parse
                         if not current_experience['company']:
-                            for ent in nlp(line).ents:
+                            for ent in sent.ents:
                                 if ent.label_ in ['ORG', 'ORGANIZATION']:
                                     current_experience['company'] = ent.text
                                     break
@@ -569,7 +614,7 @@ class PDFExtractor:
                             for pattern in duration_patterns:
                                 match = re.search(pattern, line.lower())
                                 if match:
-                                    current_experience['duration'] = match.group(1)
+                                    current_experience['duration'] = match.group(match.lastindex or 0)
                                     break
                         
                         # Extract location
@@ -663,3 +708,65 @@ class PDFExtractor:
             return []
 
         return experience
+
+    @instrumented('extract_resume')
+    def extract_resume(self, pdf_path: str) -> Dict:
+        """Run every extraction stage on one resume and return a JSON-ready record"""
+        # Identical documents are served from the cache without parsing
+        cache_key = None
+        if self.cache is not None:
+            try:
+                cache_key = self.cache.key_for_file(pdf_path)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    # Only the skill stages are rerun after skills.json changes
+                    if cached.get('skills_version') != skills_db_version():
+                        self.refresh_skills(cached)
+                        self._save_skills_snapshot()
+                        try:
+                            self.cache.put(cache_key, cached)
+                        except OSError as e:
+                            print(f"Warning: Could not write result cache: {str(e)}")
+                    cached['file'] = pdf_path
+                    return cached
+            except OSError as e:
+                print(f"Warning: Result cache unavailable: {str(e)}")
+                cache_key = None
+        
+        document = self.parse_document(pdf_path)
+        text = self.extract_text(document)
+        
+        # One pass finds every section; each stage then reads only its own
+        sections = self.find_sections(text, document)
+        contacts = self.extract_contacts(text)
+        name = self.extract_name(text, document)
+        skills = self.extract_skills(text, document)
+        experience = self.extract_experience(text, document)
+        
+        record = {
+            'file': pdf_path,
+            'name': name,
+            'email': contacts['email'],
+            'phone': contacts['phone'],
+            'linkedin': contacts['linkedin'],
+            'github': contacts['github'],
+            'skills': skills,
+            'experience': experience,
+            'summary': self.generate_resume_summary(name, skills, experience),
+            'backend': document.backend,
+            'limits_hit': list(document.limits_hit),
+            'skills_version': skills_db_version(),
+            'cache_version': cache_version(self.backend, self.limits),
+            'sections': {section: list(span) for section, span in sections.items()},
+            'text': text
+        }
+        
+        # A result cut short by the time limit depends on machine load, so it is not reused
+        if cache_key is not None and SECONDS not in document.limits_hit:
+            try:
+                self._save_skills_snapshot()
+                self.cache.put(cache_key, record)
+            except OSError as e:
+                print(f"Warning: Could not write result cache: {str(e)}")
+        
+        return record
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Iterator, Optional, Tuple
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Subdirectory for the skills.json versions cached results were made with
+SNAPSHOT_DIR = 'skills'
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Content-addressed on-disk cache of extraction results with LRU eviction"""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES, version: str = ''):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._total_bytes = sum(size for _, size, _ in self._entries())
+
+    @classmethod
+    def from_env(cls, version: str = '') -> Optional['ResultCache']:
+        """Build a cache from RESUME_CACHE_DIR and RESUME_CACHE_MAX_MB, if set"""
+        directory = os.environ.get('RESUME_CACHE_DIR')
+        if not directory:
+            return None
+        max_mb = float(os.environ.get('RESUME_CACHE_MAX_MB', DEFAULT_MAX_BYTES / (1024 * 1024)))
+        return cls(directory, int(max_mb * 1024 * 1024), version)
+
+    def key_for_file(self, path: str) -> str:
+        """Cache key from the document bytes plus the extractor version"""
+        return self.key_for_hash(hash_file(path))
+
+    def key_for_hash(self, content_hash: str) -> str:
+        return hashlib.sha256(f"{content_hash}:{self.version}".encode('utf-8')).hexdigest()
+
+    @property
+    def snapshot_dir(self) -> str:
+        return os.path.join(self.directory, SNAPSHOT_DIR)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def _entries(self):
+        """(path, size, mtime) for every cached entry"""
+        for root, dirs, files in os.walk(self.directory):
+            for filename in files:
+                if not filename.endswith('.json'):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a cached result, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        """(key, result) for every cached entry, without counting hits or touching entries"""
+        for path, _, _ in list(self._entries()):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    result = json.load(f)
+            except (OSError, ValueError):
+                continue
+            yield os.path.basename(path)[:-len('.json')], result
+
+    def put(self, key: str, result: Dict):
+        """Store a result, evicting least recently used entries over the size bound"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        # Rewriting an entry replaces its bytes
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._total_bytes += len(data) - replaced
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Delete the oldest entries until the cache fits in max_bytes"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+        self._total_bytes = total
+
+    def clear(self):
+        with self._lock:
+            for path, _, _ in list(self._entries()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counters plus the current size of the cache"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'bytes': self._total_bytes,
+            'max_bytes': self.max_bytes
+        }
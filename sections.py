@@ -0,0 +1,119 @@
+from typing import Dict, Optional, Tuple
+
+# Sections an extractor can be limited to; contact is the text above the first heading
+SECTIONS = ('contact', 'summary', 'skills', 'experience', 'education', 'projects')
+
+# Heading words of each section. 'other' headings end the current section
+# without starting a tracked one.
+SECTION_HEADINGS = {
+    'summary': (
+        'summary', 'professional summary', 'career summary', 'objective', 'career objective',
+        'profile', 'professional profile', 'about me'
+    ),
+    'skills': (
+        'skills', 'technical skills', 'key skills', 'soft skills', 'expertise', 'technical expertise',
+        'technologies', 'programming languages', 'core competencies', 'competencies'
+    ),
+    'experience': (
+        'experience', 'work experience', 'professional experience', 'employment',
+        'employment history', 'career history', 'work history', 'professional background'
+    ),
+    'education': ('education', 'academic background', 'qualifications'),
+    'projects': ('projects', 'personal projects', 'key projects'),
+    'other': (
+        'certifications', 'certificates', 'achievements', 'awards', 'publications', 'languages',
+        'interests', 'hobbies', 'references', 'volunteering', 'volunteer experience'
+    ),
+}
+
+# Only headings when they are the whole label: "Languages" lists spoken
+# languages, while "Programming Languages" belongs to the skills
+STANDALONE_HEADINGS = ('languages',)
+
+# Longer lines are content, not headings
+MAX_HEADING_WORDS = 5
+MAX_HEADING_CHARS = 50
+
+_HEADINGS = {
+    heading: section
+    for section, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+_HEADING_PUNCTUATION = ' \t:•-–|*#'
+# Words that may be lowercase in a title case heading, e.g. Certifications and Awards
+_CONNECTORS = {'and', '&', 'of', 'in', 'for', '/'}
+
+
+def heading_section(line: str) -> Optional[str]:
+    """The section a line opens when it is a heading, 'other' for untracked headings, else None
+
+    A heading is a known heading on its own or before a colon, e.g.
+    "Skills: Python, SQL", or a short title case line ending with one, e.g.
+    "Relevant Work Experience", or starting with one before a connector,
+    e.g. "Education & Training".
+    """
+    label = line.split(':', 1)[0].strip(_HEADING_PUNCTUATION)
+    if not label or len(label) > MAX_HEADING_CHARS:
+        return None
+    words = label.split()
+    lowered = ' '.join(words).lower()
+    if lowered in _HEADINGS:
+        return _HEADINGS[lowered]
+    if len(words) > MAX_HEADING_WORDS:
+        return None
+    if any(word[0].islower() and word not in _CONNECTORS for word in words):
+        return None
+
+    # A keyword at the end, e.g. Cloud Technologies, or before a connector, e.g. Education & Training
+    lowered_words = lowered.split()
+    candidates = [' '.join(lowered_words[-2:]), lowered_words[-1].strip(_HEADING_PUNCTUATION)]
+    if len(lowered_words) > 2 and lowered_words[1] in _CONNECTORS:
+        candidates.append(lowered_words[0])
+    for candidate in candidates:
+        if candidate in _HEADINGS and candidate not in STANDALONE_HEADINGS:
+            return _HEADINGS[candidate]
+    return None
+
+
+def _is_label_line(line: str, section: str) -> bool:
+    """Whether a heading-like line is a "Label: values" entry, e.g. "Languages: Python, Java"
+
+    Inside a section such lines list its content; only the plain name of
+    another section, e.g. "Education: B.Sc. ...", still opens that section.
+    """
+    label, colon, values = line.partition(':')
+    if not colon or not values.strip():
+        return False
+    return ' '.join(label.strip(_HEADING_PUNCTUATION).lower().split()) != section
+
+
+def find_sections(text: str) -> Dict[str, Tuple[int, int]]:
+    """(start, end) character spans of the resume's sections, found in one pass over its lines
+
+    'contact' runs from the start of the text to the first heading; every
+    other section runs from its heading line to the next heading. Inside a
+    tracked section, "Label: values" lines are content rather than headings.
+    A section whose heading comes up again, e.g. Technical Skills followed
+    later by Soft Skills, is extended to the end of its last block. Sections
+    without a heading are absent.
+    """
+    sections: Dict[str, Tuple[int, int]] = {}
+    current, start = 'contact', 0
+
+    def close(end: int):
+        if current == 'other':
+            return
+        previous = sections.get(current)
+        sections[current] = (previous[0] if previous else start, max(end, start))
+
+    offset = 0
+    for line in text.split('\n'):
+        section = heading_section(line)
+        if section is not None and current not in ('contact', 'other') and _is_label_line(line, section):
+            section = None
+        if section is not None:
+            close(offset - 1)
+            current, start = section, offset
+        offset += len(line) + 1
+    close(len(text))
+    return sections
@@ -0,0 +1,285 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from batch import init_worker, process_resume
+from document_formats import document_format
+from extraction_limits import BYTES, ExtractionLimits
+from instrumentation import PrometheusSink, metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8000
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MAX_UPLOAD_MB = 20.0
+# Every worker holds its own spaCy pipeline, so the default stays small
+# even where the host has many CPUs
+MAX_DEFAULT_WORKERS = 4
+
+
+def default_workers() -> int:
+    """CPUs this process may run on, as limited by its affinity mask, capped at MAX_DEFAULT_WORKERS"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS or Windows
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, MAX_DEFAULT_WORKERS))
+
+
+def _worker_ready() -> int:
+    """No-op task used to start and pre-warm every worker process"""
+    return os.getpid()
+
+
+class ServiceBusy(Exception):
+    """Raised when the request queue is full"""
+
+
+class ServiceUnavailable(Exception):
+    """Raised when the worker pool cannot take requests"""
+
+
+class ExtractionService:
+    """Pre-warmed process pool behind a bounded request queue"""
+
+    def __init__(self, workers: int = None, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 timeout: float = DEFAULT_TIMEOUT, cache_dir: str = None, limits: ExtractionLimits = None,
+                 backend: str = None):
+        self.workers = workers or default_workers()
+        self.queue_size = queue_size
+        self.timeout = timeout
+        # Requests either running on a worker or waiting for one
+        self._slots = threading.BoundedSemaphore(self.workers + queue_size)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._upload_dir = tempfile.mkdtemp(prefix='resume-uploads-')
+        self._initargs = (cache_dir, None, limits, True, backend)
+        self._pool = self._new_pool()
+        self.ready = False
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker, initargs=self._initargs)
+
+    def warm_up(self):
+        """Start every worker and wait until its models are loaded"""
+        pool = self._pool
+        try:
+            futures = [pool.submit(_worker_ready) for _ in range(self.workers)]
+            pids = {future.result() for future in futures}
+        except Exception as e:
+            logger.error(f"Workers failed to start: {str(e)}")
+            return
+        # A pool replaced while warming up is warmed by its own restart
+        if pool is self._pool:
+            self.ready = True
+            logger.info(f"{len(pids)} workers ready")
+
+    def _restart(self, broken: ProcessPoolExecutor):
+        """Replace a pool whose worker died, e.g. killed for memory, and warm up the new one"""
+        with self._lock:
+            # Every request on the broken pool fails; only the first one restarts it
+            if broken is not self._pool:
+                return
+            self.ready = False
+            self._pool = self._new_pool()
+        logger.error("A worker process died, restarting the worker pool")
+        broken.shutdown(wait=False, cancel_futures=True)
+        threading.Thread(target=self.warm_up, daemon=True).start()
+
+    def extract(self, data: bytes, filename: str) -> Dict:
+        """Run extraction on a worker, raising ServiceBusy, ServiceUnavailable or TimeoutError"""
+        if not self.ready:
+            raise ServiceUnavailable("Workers are still loading")
+        if not self._slots.acquire(blocking=False):
+            raise ServiceBusy("Request queue is full")
+
+        fd, path = tempfile.mkstemp(dir=self._upload_dir, suffix=os.path.splitext(filename)[1] or '.pdf')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+
+        pool = self._pool
+        try:
+            future = pool.submit(process_resume, path, False, True)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._release(path)
+            if isinstance(e, BrokenProcessPool):
+                self._restart(pool)
+            raise ServiceUnavailable(str(e))
+
+        with self._lock:
+            self._in_flight += 1
+        # The slot is held until the worker finishes, even if the client timed out
+        future.add_done_callback(lambda _: self._release(path, finished=True))
+
+        try:
+            record = future.result(timeout=self.timeout)
+        except BrokenProcessPool as e:
+            self._restart(pool)
+            raise ServiceUnavailable(f"Worker process died: {str(e)}")
+        record['file'] = filename
+        # Errors name the temporary upload; clients only know their own file name
+        if 'error' in record:
+            record['error'] = record['error'].replace(path, filename)
+        for event in record.pop('metrics', None) or []:
+            metrics.emit(event)
+        return record
+
+    def _release(self, path: str, finished: bool = False):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        if finished:
+            with self._lock:
+                self._in_flight -= 1
+        self._slots.release()
+
+    def stats(self) -> Dict:
+        return {
+            'ready': self.ready,
+            'workers': self.workers,
+            'queue_size': self.queue_size,
+            'in_flight': self._in_flight
+        }
+
+    def shutdown(self):
+        self.ready = False
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ExtractionHandler(BaseHTTPRequestHandler):
+    """POST /extract with the raw PDF as the body; GET /healthz for status, GET /metrics for Prometheus"""
+
+    service: ExtractionService = None
+    prometheus: PrometheusSink = None
+    max_upload_bytes = int(DEFAULT_MAX_UPLOAD_MB * 1024 * 1024)
+
+    def _send_json(self, status: int, body: Dict, headers: Dict[str, str] = None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if urlparse(self.path).path == '/healthz':
+            stats = self.service.stats()
+            status = HTTPStatus.OK if stats['ready'] else HTTPStatus.SERVICE_UNAVAILABLE
+            self._send_json(status, stats)
+        elif urlparse(self.path).path == '/metrics' and self.prometheus is not None:
+            data = self.prometheus.render().encode('utf-8')
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': 'Not found'})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/extract':
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': 'Not found'})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length <= 0:
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': 'Request body must contain the resume'})
+            return
+        if length > self.max_upload_bytes:
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': 'Upload too large'})
+            return
+
+        filename = parse_qs(url.query).get('filename', [self.headers.get('X-Filename', 'resume.pdf')])[0]
+        # The extension picks the reader: .pdf (the default), .docx or .txt
+        try:
+            document_format(filename)
+        except ValueError as e:
+            self._send_json(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, {'error': str(e)})
+            return
+        data = self.rfile.read(length)
+        status, body, headers = self._extract(data, os.path.basename(filename))
+        self._send_json(status, body, headers)
+
+    def _extract(self, data: bytes, filename: str) -> Tuple[int, Dict, Dict[str, str]]:
+        try:
+            record = self.service.extract(data, filename)
+        except ServiceBusy as e:
+            return HTTPStatus.TOO_MANY_REQUESTS, {'error': str(e)}, {'Retry-After': '1'}
+        except ServiceUnavailable as e:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {'error': str(e)}, {'Retry-After': '5'}
+        except TimeoutError:
+            return HTTPStatus.GATEWAY_TIMEOUT, {'error': f"Extraction exceeded {self.service.timeout:g}s"}, {}
+
+        if BYTES in record.get('limits_hit', ()):
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, record, {}
+        if 'error' in record:
+            return HTTPStatus.UNPROCESSABLE_ENTITY, record, {}
+        return HTTPStatus.OK, record, {}
+
+    def log_message(self, format, *args):
+        logger.info("%s - %s", self.address_string(), format % args)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="HTTP resume extraction service")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', DEFAULT_PORT)))
+    parser.add_argument('-w', '--workers', type=int, default=None, help=f"Worker processes (default: available CPUs, at most {MAX_DEFAULT_WORKERS})")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE, help="Requests allowed to wait for a worker before 429")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="Per-request timeout in seconds")
+    parser.add_argument('--max-upload-mb', type=float, default=DEFAULT_MAX_UPLOAD_MB)
+    parser.add_argument('--max-pages', type=int, default=None, help="Parse at most this many pages per upload (default: 30, 0 for no limit)")
+    parser.add_argument('--max-chars', type=int, default=None, help="Stop reading an upload after this many characters (default: 200000, 0 for no limit)")
+    parser.add_argument('--max-seconds', type=float, default=None, help="Stop parsing an upload's pages after this many seconds (default: 30, 0 for no limit)")
+    parser.add_argument('--cache-dir', default=os.environ.get('RESUME_CACHE_DIR'))
+    parser.add_argument('--backend', default=None, help="PDF backend (default: $RESUME_PDF_BACKEND or auto)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    # Uploads are already bounded by --max-upload-mb
+    limits = ExtractionLimits.from_env(
+        max_bytes=int(args.max_upload_mb * 1024 * 1024),
+        max_pages=args.max_pages,
+        max_chars=args.max_chars,
+        max_seconds=args.max_seconds
+    )
+    service = ExtractionService(args.workers, args.queue_size, args.timeout, args.cache_dir, limits, args.backend)
+    ExtractionHandler.service = service
+    ExtractionHandler.prometheus = metrics.add_sink(PrometheusSink())
+    ExtractionHandler.max_upload_bytes = int(args.max_upload_mb * 1024 * 1024)
+
+    httpd = ThreadingHTTPServer((args.host, args.port), ExtractionHandler)
+    httpd.daemon_threads = True
+
+    # Accept connections right away; requests get 503 until the workers are warm
+    threading.Thread(target=service.warm_up, daemon=True).start()
+    logger.info(f"Listening on {args.host}:{args.port}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        service.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Tuple
+
+from skills_db import SKILLS_PATH, iter_skills, load_skills_db
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class SkillAutomaton:
+    """Aho-Corasick automaton that finds every skill in one pass over the text"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        # Nearest node on the failure chain that ends a pattern
+        self._dict_link: List[int] = [0]
+        self._patterns: List[Tuple[str, Any]] = []
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, pattern: str, value: Any):
+        """Add a lowercase pattern that reports value when matched"""
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._dict_link.append(0)
+            node = next_node
+        self._output[node].append(len(self._patterns))
+        self._patterns.append((pattern, value))
+        self._built = False
+
+    def build(self):
+        """Compute failure links breadth first"""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+            self._dict_link[node] = 0
+
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._output[fail] else self._dict_link[fail]
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (start, end, value) for every pattern occurrence in text"""
+        if not self._built:
+            self.build()
+
+        goto, fail, output, dict_link, patterns = (
+            self._goto, self._fail, self._output, self._dict_link, self._patterns
+        )
+        node = 0
+        for i, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            match_node = node if output[node] else dict_link[node]
+            while match_node:
+                for index in output[match_node]:
+                    pattern, value = patterns[index]
+                    yield i + 1 - len(pattern), i + 1, value
+                match_node = dict_link[match_node]
+
+    def find(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """Yield matches that start and end on word boundaries"""
+        length = len(text)
+        for start, end, value in self.iter_matches(text):
+            if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                continue
+            if end < length and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+                continue
+            yield start, end, value
+
+
+def skill_variations(skill: str) -> List[str]:
+    """Spellings a skill may appear under: 'machine learning', 'machinelearning', 'machine_learning'"""
+    skill_words = skill.lower().split()
+    variations = [' '.join(skill_words), ''.join(skill_words), '_'.join(skill_words)]
+    return list(dict.fromkeys(variations))
+
+
+def compile_skills(skills_db: Dict) -> SkillAutomaton:
+    """Compile every skill in the database into one automaton of (category, skill) values"""
+    automaton = SkillAutomaton()
+    for category, skill in iter_skills(skills_db):
+        for variation in skill_variations(skill):
+            automaton.add(variation, (category, skill))
+    automaton.build()
+    return automaton
+
+
+_automata: Dict[str, Tuple[float, SkillAutomaton]] = {}
+_lock = threading.Lock()
+
+
+def get_skill_automaton(path: str = SKILLS_PATH) -> SkillAutomaton:
+    """Return the compiled automaton for a skills file, rebuilding it when the file changes"""
+    mtime = os.path.getmtime(path)
+    cached = _automata.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _lock:
+        automaton = compile_skills(load_skills_db(path))
+        _automata[path] = (mtime, automaton)
+    return automaton
@@ -1,28 +1,33 @@
-import json
+import re
+from collections import defaultdict
 from typing import Dict, List
-import spacy
+
+from instrumentation import instrumented
+from model_registry import get_nlp
+from skill_automaton import compile_skills, skill_variations
+from skills_db import build_category_index, iter_skills, load_skills_db
+
+# Matching and context windows only need tokens, so every trained component is excluded
+CLASSIFIER_COMPONENTS = ()
 
 class SkillClassifier:
     def __init__(self):
         """Initialize skill classifier with skills database and NLP model"""
         try:
             # Load skills from JSON file
-            with open('skills.json', 'r') as f:
-                self.skills_db = json.load(f)
+            self.skills_db = load_skills_db()
         except Exception as e:
             print(f"Warning: Could not load skills database: {str(e)}")
             self.skills_db = {}
 
-        try:
-            # Load spaCy model (small model is faster)
-            self.nlp = spacy.load('en_core_web_sm')
-        except Exception as e:
-            print(f"Warning: Could not load spaCy model: {str(e)}")
-            self.nlp = None
-
-        # Create regex patterns for all skills
-        self.skill_patterns = {}
-        self._create_skill_patterns()
+        # Index each skill to its categories for constant time lookups
+        self.category_index = build_category_index(self.skills_db)
+        
+        # Compile all skills once for the regex-free fallback path
+        self.skill_automaton = compile_skills(self.skills_db)
+        
+        # Phrase matcher is built once, the first time the spaCy model is needed
+        self._phrase_matcher = None
         
         # Create skill context patterns
         self.context_patterns = self._create_context_patterns()
@@ -30,18 +35,30 @@ class SkillClassifier:
         # Initialize context window size
         self.context_window = 5  # Number of words to consider around a skill mention
 
-    def _create_skill_patterns(self):
-        """Create regex patterns for all skills in the database"""
-        for category, skills in self.skills_db.items():
-            if isinstance(skills, dict):
-                # For nested categories
-                for subcategory, tech_stack in skills.items():
-                    for skill in tech_stack:
-                        self._add_skill_pattern(skill)
-            else:
-                # For flat list of skills
-                for skill in skills:
-                    self._add_skill_pattern(skill)
+    @property
+    def nlp(self):
+        """Shared tokenizer-only spaCy pipeline, loaded on first use
+
+        Each access counts as a reuse in the model registry, so callers fetch
+        it once and pass it on.
+        """
+        return get_nlp(components=CLASSIFIER_COMPONENTS)
+
+    def _get_phrase_matcher(self, nlp):
+        """Build a PhraseMatcher over every skill and its spacing variants"""
+        if self._phrase_matcher is None:
+            from spacy.matcher import PhraseMatcher
+            
+            matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+            # Skills differing only in case share the first spelling in the database
+            skills = {}
+            for category, skill in iter_skills(self.skills_db):
+                skills.setdefault(skill.lower(), skill)
+            for skill in skills.values():
+                # make_doc only tokenizes, so building the patterns is cheap
+                matcher.add(skill, [nlp.make_doc(v) for v in skill_variations(skill)])
+            self._phrase_matcher = matcher
+        return self._phrase_matcher
 
     def _create_context_patterns(self):
         """Create patterns to identify skill-related context"""
@@ -53,46 +70,40 @@ class SkillClassifier:
             'devops': r'\b(?:devops|ci/cd|continuous|deployment|infrastructure)\b',
             'ml': r'\b(?:machine|learning|ai|artificial|intelligence|deep|neural)\b'
         }
-        return patterns
-
-    def _add_skill_pattern(self, skill: str):
-        """Add a skill pattern to the patterns dictionary"""
-        # Clean skill name for regex
-        clean_skill = skill.lower().replace(' ', '|').replace('.', '\.')
-        if clean_skill not in self.skill_patterns:
-            self.skill_patterns[clean_skill] = skill
+        return {name: re.compile(pattern) for name, pattern in patterns.items()}
 
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text to lowercase"""
         return text.lower()
 
+    @instrumented('SkillClassifier.extract_skills')
     def extract_skills(self, text: str) -> Dict[str, List[str]]:
         """Extract technical skills and tech stacks from text with categorization using NLP"""
         try:
             # Preprocess text
             processed_text = text.lower()
             
-            # Use spaCy for better context understanding
-            if self.nlp:
-                doc = self.nlp(text)
+            # Use spaCy for better context understanding, fetched from the registry once per call
+            nlp = self.nlp
+            if nlp:
+                doc = nlp(text[:nlp.max_length])
                 
                 # Find skill mentions with context
                 found_skills = defaultdict(list)
                 
-                for token in doc:
-                    # Check if token matches any skill pattern
-                    for pattern in self.skill_patterns:
-                        if re.search(pattern, token.text.lower()):
-                            skill = self.skill_patterns[pattern]
-                            category = self._find_skill_category(skill)
-                            
-                            if category:
-                                # Get context around the skill
-                                context = self._get_context(token, doc)
-                                
-                                # Use context to validate skill mention
-                                if self._is_valid_skill_mention(skill, context):
-                                    found_skills[category].append(skill)
+                # Match every skill phrase in one pass over the Doc
+                for match_id, start, end in self._get_phrase_matcher(nlp)(doc):
+                    skill = nlp.vocab.strings[match_id]
+                    categories = self._find_skill_categories(skill)
+                    
+                    if categories:
+                        # Get context around the skill
+                        context = self._get_context(doc[start:end], doc)
+                        
+                        # Use context to validate skill mention
+                        if self._is_valid_skill_mention(skill, context):
+                            for category in categories:
+                                found_skills[category].append(skill)
                 
                 # Convert defaultdict to regular dict
                 found_skills = dict(found_skills)
@@ -119,24 +130,19 @@ class SkillClassifier:
             return {"Error extracting skills": []}
 
     def _extract_skills_regex(self, text: str) -> Dict[str, List[str]]:
-        """Fallback regex-only skill extraction"""
+        """Fallback skill extraction without spaCy, using the compiled skill automaton"""
         found_skills = defaultdict(list)
         
-        for pattern in self.skill_patterns:
-            if re.search(pattern, text):
-                skill = self.skill_patterns[pattern]
-                category = self._find_skill_category(skill)
-                
-                if category:
-                    found_skills[category].append(skill)
+        for start, end, (category, skill) in self.skill_automaton.find(' '.join(text.split())):
+            found_skills[category].append(skill)
         
         return dict(found_skills)
 
-    def _get_context(self, token, doc):
-        """Get context around a token"""
-        start = max(0, token.i - self.context_window)
-        end = min(len(doc) - 1, token.i + self.context_window)
-        return [t.text.lower() for t in doc[start:end+1]]
+    def _get_context(self, span, doc):
+        """Get context around a matched span"""
+        start = max(0, span.start - self.context_window)
+        end = min(len(doc), span.end + self.context_window)
+        return [t.text.lower() for t in doc[start:end]]
 
     def _is_valid_skill_mention(self, skill: str, context: List[str]) -> bool:
         """Check if skill mention is valid based on context"""
@@ -144,7 +150,7 @@ class SkillClassifier:
         
         # Check for common skill-related context
         for pattern in self.context_patterns.values():
-            if any(re.search(pattern, word) for word in context):
+            if any(pattern.search(word) for word in context):
                 return True
         
         # Check if skill is used as a proper noun or tech term
@@ -159,15 +165,9 @@ class SkillClassifier:
 
     def _find_skill_category(self, skill: str) -> str:
         """Find which category a skill belongs to"""
-        skill = skill.lower()
-        for category, skills in self.skills_db.items():
-            if isinstance(skills, dict):
-                # For nested categories
-                for subcategory, tech_stack in skills.items():
-                    if skill in [s.lower() for s in tech_stack]:
-                        return f"{category} - {subcategory}"
-            else:
-                # For flat list of skills
-                if skill in [s.lower() for s in skills]:
-                    return category
-        return None
\ No newline at end of file
+        categories = self.category_index.get(skill.lower())
+        return categories[0] if categories else None
+
+    def _find_skill_categories(self, skill: str) -> List[str]:
+        """Find every category a skill is listed under"""
+        return self.category_index.get(skill.lower(), [])
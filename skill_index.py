@@ -0,0 +1,317 @@
+"""Inverted skill index over processed resumes with boolean search
+
+    python skill_index.py build results.jsonl -o skills.idx.npz
+    python skill_index.py query skills.idx.npz "Python AND (AWS OR Azure) AND NOT PHP" -k 20
+"""
+import argparse
+import json
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from export import read_jsonl, record_skills
+from skills_db import load_skills_db, skill_vocabulary
+
+POSTING_DTYPE = np.uint32
+
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_OPERATORS = ('AND', 'OR', 'NOT')
+
+
+class QueryError(ValueError):
+    """Raised for malformed queries and unknown skills"""
+
+
+def parse_query(query: str):
+    """Parse a boolean skill query into a tree of ('and'|'or', [children]), ('not', child) and ('skill', name)
+
+    AND binds tighter than OR, NOT applies to the next skill or group, and
+    adjacent words form one multi-word skill. Operators are case-insensitive;
+    quote a skill to use an operator word in its name.
+    """
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _TOKEN.match(query, position)
+        if match is None or match.end() == position:
+            raise QueryError(f"Unexpected character at {position}: {query[position:]!r}")
+        position = match.end()
+        open_paren, close_paren, quoted, word = match.groups()
+        if open_paren or close_paren:
+            tokens.append((open_paren or close_paren, None))
+        elif quoted is not None:
+            tokens.append(('word', quoted))
+        elif word.upper() in _OPERATORS:
+            tokens.append((word.upper(), None))
+        else:
+            tokens.append(('word', word))
+
+    tree, position = _parse_or(tokens, 0)
+    if position != len(tokens):
+        raise QueryError(f"Unexpected {tokens[position][1] or tokens[position][0]!r} in query")
+    return tree
+
+
+def _parse_or(tokens, position):
+    children = []
+    node, position = _parse_and(tokens, position)
+    children.append(node)
+    while position < len(tokens) and tokens[position][0] == 'OR':
+        node, position = _parse_and(tokens, position + 1)
+        children.append(node)
+    return (children[0] if len(children) == 1 else ('or', children)), position
+
+
+def _parse_and(tokens, position):
+    children = []
+    node, position = _parse_not(tokens, position)
+    children.append(node)
+    while position < len(tokens) and tokens[position][0] == 'AND':
+        node, position = _parse_not(tokens, position + 1)
+        children.append(node)
+    return (children[0] if len(children) == 1 else ('and', children)), position
+
+
+def _parse_not(tokens, position):
+    if position >= len(tokens):
+        raise QueryError("Query ends where a skill was expected")
+    kind = tokens[position][0]
+    if kind == 'NOT':
+        node, position = _parse_not(tokens, position + 1)
+        return ('not', node), position
+    if kind == '(':
+        node, position = _parse_or(tokens, position + 1)
+        if position >= len(tokens) or tokens[position][0] != ')':
+            raise QueryError("Missing closing parenthesis")
+        return node, position + 1
+    if kind != 'word':
+        raise QueryError(f"Expected a skill, found {kind!r}")
+
+    # Consecutive words are one skill, e.g. machine learning
+    words = []
+    while position < len(tokens) and tokens[position][0] == 'word':
+        words.append(tokens[position][1])
+        position += 1
+    return ('skill', ' '.join(' '.join(words).split()).lower()), position
+
+
+def _positive_skills(node) -> List[str]:
+    """Skills that count towards a match, i.e. those not under a NOT"""
+    kind = node[0]
+    if kind == 'skill':
+        return [node[1]]
+    if kind == 'not':
+        return []
+    return [skill for child in node[1] for skill in _positive_skills(child)]
+
+
+def top_positions(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest scores, best first; ties go to the lower position
+
+    Uses argpartition, so only the selected scores are sorted.
+    """
+    if k <= 0 or not len(scores):
+        return np.empty(0, dtype=np.int64)
+    if k >= len(scores):
+        return np.lexsort((np.arange(len(scores)), -scores))
+    threshold = -np.partition(-scores, k - 1)[k - 1]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+    top = np.concatenate((above, ties))
+    return top[np.lexsort((top, -scores[top]))]
+
+
+class SkillIndex:
+    """Maps each skill in skills.json to the sorted IDs of the resumes that list it
+
+    Resumes get consecutive integer IDs in the order they are added, so
+    appending keeps every posting list sorted. Postings are NumPy uint32
+    arrays; AND, OR and NOT are sorted-array intersections, unions and
+    differences.
+    """
+
+    def __init__(self, skills: Optional[List[str]] = None):
+        self.skills = skills if skills is not None else skill_vocabulary(load_skills_db())
+        self.documents: List[Dict[str, str]] = []
+        self._postings: Dict[str, np.ndarray] = {}
+        # Postings added since the last query or save, merged lazily
+        self._pending: Dict[str, List[int]] = {}
+        self._known = set(self.skills)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, record: Dict) -> int:
+        """Index one extraction record (with the category/tech_stack skills output) and return its ID"""
+        doc_id = len(self.documents)
+        self.documents.append({'file': record.get('file', ''), 'name': record.get('name', '')})
+        for skill in set(record_skills(record)):
+            if skill in self._known:
+                self._pending.setdefault(skill, []).append(doc_id)
+        return doc_id
+
+    def add_all(self, records: Iterable[Dict]) -> 'SkillIndex':
+        for record in records:
+            self.add(record)
+        return self
+
+    def _flush(self):
+        for skill, doc_ids in self._pending.items():
+            added = np.asarray(doc_ids, dtype=POSTING_DTYPE)
+            current = self._postings.get(skill)
+            self._postings[skill] = added if current is None else np.concatenate((current, added))
+        self._pending.clear()
+
+    def postings(self, skill: str) -> np.ndarray:
+        """Sorted IDs of the resumes that list the skill"""
+        skill = skill.lower()
+        if skill not in self._known:
+            raise QueryError(f"Unknown skill: {skill}")
+        if self._pending:
+            self._flush()
+        return self._postings.get(skill, np.empty(0, dtype=POSTING_DTYPE))
+
+    def document_frequency(self) -> Dict[str, int]:
+        """Number of resumes per skill"""
+        if self._pending:
+            self._flush()
+        return {skill: len(postings) for skill, postings in self._postings.items()}
+
+    def _evaluate(self, node) -> np.ndarray:
+        kind = node[0]
+        if kind == 'skill':
+            return self.postings(node[1])
+        if kind == 'not':
+            return np.setdiff1d(self._all(), self._evaluate(node[1]), assume_unique=True)
+        if kind == 'or':
+            result = self._evaluate(node[1][0])
+            for child in node[1][1:]:
+                result = np.union1d(result, self._evaluate(child))
+            return result
+
+        # AND: intersect the positive terms, smallest first, then remove the negated ones
+        positives = [self._evaluate(child) for child in node[1] if child[0] != 'not']
+        negatives = [self._evaluate(child[1]) for child in node[1] if child[0] == 'not']
+        if positives:
+            positives.sort(key=len)
+            result = positives[0]
+            for postings in positives[1:]:
+                if not len(result):
+                    break
+                result = np.intersect1d(result, postings, assume_unique=True)
+        else:
+            result = self._all()
+        for postings in negatives:
+            result = np.setdiff1d(result, postings, assume_unique=True)
+        return result
+
+    def _all(self) -> np.ndarray:
+        return np.arange(len(self.documents), dtype=POSTING_DTYPE)
+
+    def match(self, query: str) -> np.ndarray:
+        """Sorted IDs of the resumes matching a boolean query"""
+        return self._evaluate(parse_query(query)).astype(POSTING_DTYPE, copy=False)
+
+    def match_counts(self, skills: Iterable[str]) -> np.ndarray:
+        """For every resume, how many of the skills it lists"""
+        postings = [self.postings(skill) for skill in set(skill.lower() for skill in skills)]
+        if not postings:
+            return np.zeros(len(self.documents), dtype=np.int64)
+        return np.bincount(np.concatenate(postings), minlength=len(self.documents))
+
+    def top_k(self, skills: Iterable[str], k: int = 10, candidates: Optional[np.ndarray] = None) -> List[Tuple[int, int]]:
+        """(resume ID, match count) of the k resumes listing the most of the skills, ties by ID"""
+        if k <= 0:
+            return []
+        counts = self.match_counts(skills)
+        if candidates is not None:
+            scores = counts[candidates]
+            ids = candidates.astype(np.int64)
+        else:
+            scores = counts
+            ids = np.arange(len(counts))
+            # Resumes with none of the skills are not results
+            keep = scores > 0
+            scores, ids = scores[keep], ids[keep]
+        top = top_positions(scores, k)
+        return [(int(ids[i]), int(scores[i])) for i in top]
+
+    def search(self, query: str, k: int = 10) -> List[Dict]:
+        """Resumes matching the query, ranked by how many of its (non-negated) skills they list"""
+        tree = parse_query(query)
+        matches = self._evaluate(tree)
+        results = []
+        for doc_id, score in self.top_k(_positive_skills(tree), k, candidates=matches):
+            results.append(dict(self.documents[doc_id], id=doc_id, matches=score))
+        return results
+
+    def save(self, path: str):
+        """Write the index as one compressed .npz: every posting list concatenated, plus offsets"""
+        if self._pending:
+            self._flush()
+        lengths = [len(self._postings.get(skill, ())) for skill in self.skills]
+        offsets = np.zeros(len(self.skills) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        postings = [self._postings[skill] for skill in self.skills if skill in self._postings]
+        np.savez_compressed(
+            path,
+            postings=np.concatenate(postings) if postings else np.empty(0, dtype=POSTING_DTYPE),
+            offsets=offsets,
+            skills=np.frombuffer(json.dumps(self.skills).encode('utf-8'), dtype=np.uint8),
+            documents=np.frombuffer(json.dumps(self.documents).encode('utf-8'), dtype=np.uint8)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'SkillIndex':
+        """Read an index written by save; posting lists are views into one array"""
+        with np.load(path) as arrays:
+            index = cls(json.loads(arrays['skills'].tobytes().decode('utf-8')))
+            index.documents = json.loads(arrays['documents'].tobytes().decode('utf-8'))
+            postings, offsets = arrays['postings'], arrays['offsets']
+        for position, skill in enumerate(index.skills):
+            start, end = offsets[position], offsets[position + 1]
+            if end > start:
+                index._postings[skill] = postings[start:end]
+        return index
+
+
+def build_index(records_path: str, index_path: str) -> SkillIndex:
+    """Index the records of a batch output file and save the index"""
+    index = SkillIndex().add_all(read_jsonl(records_path))
+    index.save(index_path)
+    return index
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Inverted skill index over processed resumes")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help="Index a batch output file")
+    build.add_argument('records', help="JSONL written by batch.py")
+    build.add_argument('-o', '--output', default='skills.idx.npz')
+    query = commands.add_parser('query', help="Search an index")
+    query.add_argument('index')
+    query.add_argument('query', help='e.g. "Python AND (AWS OR Azure) AND NOT PHP"')
+    query.add_argument('-k', type=int, default=10, help="Number of results (default: 10)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        index = build_index(args.records, args.output)
+        print(f"Indexed {len(index)} resumes into {args.output}")
+        return 0
+
+    index = SkillIndex.load(args.index)
+    try:
+        results = index.search(args.query, args.k)
+    except QueryError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        return 2
+    for result in results:
+        print(f"{result['matches']:3d}  {result['name'] or '-':30}  {result['file']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
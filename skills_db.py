@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+# skills.json ships next to the code, so don't depend on the working directory
+SKILLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills.json')
+
+# Copies of earlier skills files, named by version, so a result can be diffed against the file it was made with
+SNAPSHOT_SUFFIX = '.skills'
+
+_cache: Dict[str, Tuple[float, Dict[str, List[str]]]] = {}
+_versions: Dict[str, Tuple[float, str]] = {}
+_lock = threading.Lock()
+
+
+def load_skills_db(path: str = SKILLS_PATH) -> Dict[str, List[str]]:
+    """Load the skills database once, reloading only when the file changes"""
+    mtime = os.path.getmtime(path)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _lock:
+        with open(path, 'r') as f:
+            skills_db = json.load(f)
+        _cache[path] = (mtime, skills_db)
+    return skills_db
+
+
+def skills_db_version(path: str = SKILLS_PATH) -> str:
+    """Short content hash of the skills file, used to tag cached results"""
+    mtime = os.path.getmtime(path)
+    cached = _versions.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        version = hashlib.sha256(f.read()).hexdigest()[:16]
+    _versions[path] = (mtime, version)
+    return version
+
+
+def iter_skills(skills_db: Dict) -> List[Tuple[str, str]]:
+    """Flatten the database into (category, skill) pairs, including nested categories"""
+    pairs = []
+    for category, skills in skills_db.items():
+        if isinstance(skills, dict):
+            for subcategory, tech_stack in skills.items():
+                pairs.extend((f"{category} - {subcategory}", skill) for skill in tech_stack)
+        else:
+            pairs.extend((category, skill) for skill in skills)
+    return pairs
+
+
+def build_category_index(skills_db: Dict) -> Dict[str, List[str]]:
+    """Map each lowercase skill to every category it is listed under, in database order"""
+    index: Dict[str, List[str]] = {}
+    for category, skill in iter_skills(skills_db):
+        categories = index.setdefault(skill.lower(), [])
+        if category not in categories:
+            categories.append(category)
+    return index
+
+
+def skill_vocabulary(skills_db: Dict) -> List[str]:
+    """Every lowercase skill once, in database order; the skill's ID is its lowercase name
+
+    Matrices over skills use this order for their columns and are saved with
+    it, so a skill keeps its ID when skills are added or reordered.
+    """
+    return list(build_category_index(skills_db))
+
+
+def diff_skills_db(old_db: Dict, new_db: Dict) -> Set[str]:
+    """Lowercase skills that were added, removed or moved between categories from old_db to new_db
+
+    A change in a skill's spelling or case counts as a change too, since
+    results report the name as written in the database.
+    """
+    def entries(skills_db):
+        index: Dict[str, Set[Tuple[str, str]]] = {}
+        for category, skill in iter_skills(skills_db):
+            index.setdefault(skill.lower(), set()).add((category, skill))
+        return index
+
+    old_entries, new_entries = entries(old_db), entries(new_db)
+    return {
+        skill for skill in old_entries.keys() | new_entries.keys()
+        if old_entries.get(skill) != new_entries.get(skill)
+    }
+
+
+def save_skills_snapshot(directory: str, path: str = SKILLS_PATH) -> str:
+    """Keep a copy of the skills file under its version in directory and return the version"""
+    version = skills_db_version(path)
+    target = os.path.join(directory, version + SNAPSHOT_SUFFIX)
+    if os.path.exists(target):
+        return version
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    # The file may have been edited since it was hashed
+    if hashlib.sha256(data).hexdigest()[:16] != version:
+        return version
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, target)
+    return version
+
+
+def load_skills_snapshot(directory: str, version: str) -> Optional[Dict]:
+    """The skills database saved under a version by save_skills_snapshot, or None if there is no copy"""
+    try:
+        with open(os.path.join(directory, version + SNAPSHOT_SUFFIX), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
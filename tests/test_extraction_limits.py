@@ -0,0 +1,16 @@
+from extraction_limits import ExtractionLimits
+
+
+def test_zero_override_disables_the_limit():
+    limits = ExtractionLimits.from_env(max_pages=0, max_chars=0, max_seconds=0.0)
+
+    assert limits.max_pages is None
+    assert limits.max_chars is None
+    assert limits.max_seconds is None
+
+
+def test_zero_in_the_environment_disables_the_limit(monkeypatch):
+    monkeypatch.setenv('RESUME_MAX_CHARS', '0')
+
+    assert ExtractionLimits.from_env().max_chars is None
+    assert ExtractionLimits.from_env(max_chars=500).max_chars == 500
@@ -0,0 +1,28 @@
+from benchmarks.corpus import write_pdf
+from pdf_extractor import PDFExtractor
+
+
+def _two_page_resume(path):
+    write_pdf(str(path), [
+        [(54, 738, 20, True, "Maria Lopez"), (54, 710, 10, False, "maria.lopez@example.com")],
+        [(54, 738, 10, False, "Phone: (555) 123-4567")],
+    ])
+
+
+def test_header_fields_read_every_scanned_page(tmp_path):
+    path = tmp_path / 'resume.pdf'
+    _two_page_resume(path)
+
+    fields = PDFExtractor().extract_header_fields(str(path), max_pages=2)
+
+    assert fields == {'name': 'Maria Lopez', 'email': 'maria.lopez@example.com', 'phone': '5551234567'}
+
+
+def test_header_fields_stop_at_the_page_limit(tmp_path):
+    path = tmp_path / 'resume.pdf'
+    _two_page_resume(path)
+
+    fields = PDFExtractor().extract_header_fields(str(path), max_pages=1)
+
+    assert fields['email'] == 'maria.lopez@example.com'
+    assert fields['phone'] == ''
@@ -0,0 +1,24 @@
+import json
+
+from batch import refresh_cache, run_batch
+from benchmarks.corpus import write_pdf
+from extraction_limits import ExtractionLimits
+
+
+def test_refresh_writes_one_record_per_resume(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'resume{i}.pdf'
+        write_pdf(str(path), [[(54, 738, 20, True, f"Person {i}"), (54, 700, 10, False, "Skills: Python, SQL")]])
+        paths.append(str(path))
+    cache_dir = str(tmp_path / 'cache')
+    limits = ExtractionLimits.from_env(max_pages=2)
+    run_batch(paths, str(tmp_path / 'a.jsonl'), 1, cache_dir)
+    run_batch(paths, str(tmp_path / 'b.jsonl'), 1, cache_dir, limits=limits)
+
+    output = tmp_path / 'refreshed.jsonl'
+    counts = refresh_cache(cache_dir, str(output), limits=limits)
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(record['file'] for record in records) == paths
+    assert counts['skipped'] == 3
@@ -0,0 +1,10 @@
+from batch import iter_resume_paths
+
+
+def test_directory_scan_skips_extracted_text(tmp_path):
+    for filename in ('alice.pdf', 'alice_extracted.txt', 'bob.txt', 'notes.md'):
+        (tmp_path / filename).write_text('')
+
+    paths = list(iter_resume_paths(str(tmp_path)))
+
+    assert paths == [str(tmp_path / 'alice.pdf'), str(tmp_path / 'bob.txt')]
@@ -0,0 +1,59 @@
+from pdf_extractor import PDFExtractor
+from sections import find_sections
+
+SKILL_LABELS_RESUME = """Jane Doe
+jane@example.com
+
+Technical Skills
+Languages: Python, Java, C++
+Frameworks: Django, React
+Tools: Git, Docker, Kubernetes
+
+Soft Skills
+Communication, Leadership
+
+Education
+B.Sc. Computer Science
+"""
+
+
+def _section_text(text, name):
+    start, end = find_sections(text)[name]
+    return text[start:end]
+
+
+def test_label_lines_stay_in_the_skills_section():
+    skills = _section_text(SKILL_LABELS_RESUME, 'skills')
+
+    assert 'Languages: Python, Java, C++' in skills
+    assert 'Tools: Git, Docker, Kubernetes' in skills
+
+
+def test_repeated_section_is_extended():
+    skills = _section_text(SKILL_LABELS_RESUME, 'skills')
+
+    assert skills.startswith('Technical Skills')
+    assert 'Communication, Leadership' in skills
+    assert 'B.Sc.' not in skills
+
+
+def test_plain_section_label_still_opens_the_section():
+    text = "Experience\nEngineer at Acme\nTechnologies: AWS, Docker\nEducation: B.Sc. Physics\n"
+
+    experience = _section_text(text, 'experience')
+
+    assert 'Technologies: AWS, Docker' in experience
+    assert _section_text(text, 'education').startswith('Education: B.Sc.')
+
+
+def test_standalone_languages_heading_ends_the_section():
+    text = "Skills\nPython\n\nLanguages\nEnglish, Spanish\n"
+
+    assert 'English' not in _section_text(text, 'skills')
+
+
+def test_skill_labels_resume_skills():
+    found = PDFExtractor().extract_skills(SKILL_LABELS_RESUME)
+    skills = {skill.lower() for group in found for skill in group['tech_stack']}
+
+    assert {'python', 'java', 'c++', 'django', 'react', 'git', 'docker', 'kubernetes'} <= skills
@@ -0,0 +1,11 @@
+def normalize_text(text: str) -> str:
+    """Collapse whitespace in a single pass: one newline between lines, one space between words
+
+    Blank and whitespace-only lines are dropped and runs of spaces or tabs,
+    including pdfplumber's layout padding, become a single space. Splitting and
+    joining in C is several times faster than an equivalent compiled regex
+    substitution with a replacement callback.
+    """
+    if not text:
+        return ""
+    return '\n'.join(' '.join(words) for words in map(str.split, text.splitlines()) if words)